@@ -1,3 +1,4 @@
 from .suggest import GeosupportSuggest
+from .index import ResultIndex, StreetNameIndex
 
-__all__ = ["GeosupportSuggest"]
+__all__ = ["GeosupportSuggest", "ResultIndex", "StreetNameIndex"]
@@ -0,0 +1,382 @@
+"""Command-line batch geocoder: ``geosupport-suggest``."""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+import argparse
+import csv
+import json
+import logging
+import sys
+import time
+
+from .suggest import GeosupportSuggest
+
+logger = logging.getLogger(__name__)
+
+INPUT_FORMATS = ("auto", "text", "csv", "ndjson")
+OUTPUT_FORMATS = ("normalized", "geojson", "csv")
+
+CSV_FIELDS = [
+    "input",
+    "house_number",
+    "street",
+    "borough",
+    "zip",
+    "latitude",
+    "longitude",
+    "bbl",
+]
+
+
+def _detect_format(path: str) -> str:
+    """Guess the input format from a file name."""
+    lower = path.lower()
+    if lower.endswith(".csv"):
+        return "csv"
+    if lower.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return "text"
+
+
+def _borough(value: Any) -> Any:
+    """Parse an optional borough code, leaving invalid values for validation."""
+    if value in (None, ""):
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def read_addresses(
+    stream: TextIO,
+    fmt: str = "text",
+    address_column: str = "address",
+    borough_column: str = "borough_code",
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read address records from a text stream.
+
+    Args:
+        stream: Open text stream
+        fmt: 'text' (one address per line), 'csv' or 'ndjson'
+        address_column: CSV column / JSON key holding the address
+        borough_column: CSV column / JSON key holding the borough code
+
+    Yields:
+        Dicts with 'address' and 'borough_code' keys. Malformed records
+        yield the raw text as 'address' with an 'error' key instead of
+        stopping the stream.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                yield _malformed(f"line {reader.line_num}", f"invalid CSV: {e}")
+                continue
+            yield {
+                "address": row.get(address_column) or "",
+                "borough_code": _borough(row.get(borough_column)),
+            }
+    elif fmt == "ndjson":
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield _malformed(line, f"invalid JSON: {e}")
+                continue
+            if isinstance(record, str):
+                yield {"address": record, "borough_code": None}
+            elif isinstance(record, dict) and isinstance(
+                record.get(address_column) or "", str
+            ):
+                yield {
+                    "address": record.get(address_column) or "",
+                    "borough_code": _borough(record.get(borough_column)),
+                }
+            else:
+                yield _malformed(line, "expected an address string or object")
+    else:
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield {"address": line, "borough_code": None}
+
+
+def _malformed(raw: str, error: str) -> Dict[str, Any]:
+    """Record for input that could not be read as an address."""
+    return {"address": raw, "borough_code": None, "error": error}
+
+
+class OutputWriter:
+    """Incrementally write results in one of the ``OUTPUT_FORMATS``."""
+
+    def __init__(self, stream: TextIO, fmt: str, suggest: GeosupportSuggest):
+        self.stream = stream
+        self.fmt = fmt
+        self.suggest = suggest
+        self._features = 0
+        self._csv = None
+
+    def __enter__(self):
+        if self.fmt == "geojson":
+            self.stream.write('{"type": "FeatureCollection", "features": [\n')
+        elif self.fmt == "csv":
+            self._csv = csv.DictWriter(self.stream, fieldnames=CSV_FIELDS)
+            self._csv.writeheader()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.fmt == "geojson":
+            self.stream.write("\n]}\n")
+        self.stream.flush()
+
+    def write(self, input_address: str, results: List[Dict[str, Any]]) -> None:
+        """Write the results for one input address."""
+        if self.fmt == "geojson":
+            for feature in self.suggest.to_geojson(results)["features"]:
+                feature["properties"]["input"] = input_address
+                if self._features:
+                    self.stream.write(",\n")
+                self.stream.write(json.dumps(feature))
+                self._features += 1
+            return
+
+        normalized = self.suggest.normalize_results(results)
+        if self.fmt == "csv":
+            for norm in normalized:
+                coords = norm["coordinates"] or {}
+                self._csv.writerow(
+                    {
+                        "input": input_address,
+                        "house_number": norm["house_number"],
+                        "street": norm["street"],
+                        "borough": norm["borough"],
+                        "zip": norm["zip"],
+                        "latitude": coords.get("latitude", ""),
+                        "longitude": coords.get("longitude", ""),
+                        "bbl": norm["bbl"] or "",
+                    }
+                )
+        else:
+            record = {"input": input_address, "results": normalized}
+            self.stream.write(json.dumps(record) + "\n")
+
+
+class RunStats:
+    """Throughput and progress counters for a batch run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.addresses = 0
+        self.matched = 0
+        self.results = 0
+        self.errors = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self) -> str:
+        """One-line summary of the run so far."""
+        elapsed = self.elapsed
+        rate = self.addresses / elapsed if elapsed > 0 else 0.0
+        return (
+            f"{self.addresses} addresses, {self.matched} matched, "
+            f"{self.results} results, {self.errors} errors "
+            f"in {elapsed:.2f}s ({rate:.1f} addresses/s)"
+        )
+
+
+def _geocode(
+    suggest: GeosupportSuggest, record: Dict[str, Any], parallel: bool
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Geocode one record; returns its results and whether it was an error."""
+    address = record["address"]
+    try:
+        if record.get("error"):
+            raise ValueError(record["error"])
+        results = suggest.suggestions(
+            address, borough_code=record.get("borough_code"), parallel=parallel
+        )
+    except ValueError as e:
+        logger.warning(f"Skipping {address!r}: {e}")
+        return [], True
+    return results, False
+
+
+def run(
+    suggest: GeosupportSuggest,
+    records: Iterable[Dict[str, Any]],
+    writer: OutputWriter,
+    parallel: bool = False,
+    progress_every: int = 0,
+    progress_stream: Optional[TextIO] = None,
+    concurrency: int = 1,
+) -> RunStats:
+    """
+    Stream address records through ``suggest`` and write each result.
+
+    Args:
+        suggest: Configured GeosupportSuggest
+        records: Iterable of dicts with 'address' and 'borough_code'
+        writer: Open OutputWriter
+        parallel: Whether to use parallel processing
+        progress_every: Print a progress line every N addresses (0 disables)
+        progress_stream: Stream for progress lines, defaults to stderr
+        concurrency: Addresses geocoded at once, each on a fork of
+            ``suggest``; output stays in input order
+
+    Returns:
+        RunStats for the run
+    """
+    progress_stream = progress_stream or sys.stderr
+    stats = RunStats()
+
+    def finish(record, results, failed):
+        writer.write(record["address"], results)
+        stats.addresses += 1
+        stats.results += len(results)
+        stats.errors += failed
+        if results:
+            stats.matched += 1
+
+        if progress_every and stats.addresses % progress_every == 0:
+            progress_stream.write(stats.summary() + "\n")
+            progress_stream.flush()
+
+    if concurrency <= 1:
+        for record in records:
+            finish(record, *_geocode(suggest, record, parallel))
+        return stats
+
+    # Keep a bounded window of records in flight and write the oldest as
+    # soon as it is done, so memory stays flat and output keeps input order
+    window = concurrency * 2
+    pending: deque = deque()
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="suggest-cli"
+    ) as executor:
+        for record in records:
+            if len(pending) >= window:
+                done, future = pending.popleft()
+                finish(done, *future.result())
+            future = executor.submit(_geocode, suggest.fork(), record, parallel)
+            pending.append((record, future))
+        while pending:
+            done, future = pending.popleft()
+            finish(done, *future.result())
+    return stats
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the CLI."""
+    p = argparse.ArgumentParser(
+        prog="geosupport-suggest",
+        description="Batch geocode addresses with Geosupport suggestions.",
+    )
+    p.add_argument("input", nargs="?", default="-", help="Input file, or '-' for stdin")
+    p.add_argument("-o", "--output", default="-", help="Output file, or '-' for stdout")
+    p.add_argument("--input-format", choices=INPUT_FORMATS, default="auto")
+    p.add_argument("--output-format", choices=OUTPUT_FORMATS, default="normalized")
+    p.add_argument("--address-column", default="address")
+    p.add_argument("--borough-column", default="borough_code")
+    p.add_argument("--func", default="AP", help="Geosupport function ('AP' or '1B')")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parallel workers per address (1 disables parallel processing)",
+    )
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Addresses geocoded at once; output keeps input order",
+    )
+    p.add_argument(
+        "--rate-limit", type=float, default=0, help="Seconds between Geosupport calls"
+    )
+    p.add_argument("--no-cache", action="store_true", help="Disable result caching")
+    p.add_argument("--cache-size", type=int, default=1000)
+    p.add_argument("--cache-ttl", type=int, default=3600)
+    p.add_argument(
+        "--progress",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Print progress to stderr every N addresses",
+    )
+    p.add_argument("-q", "--quiet", action="store_true", help="Suppress the summary")
+    return p
+
+
+def main(argv: Optional[List[str]] = None, geosupport=None) -> int:
+    """Entry point for the ``geosupport-suggest`` command."""
+    args = build_parser().parse_args(argv)
+
+    # Each parallel worker and concurrent address gets its own Geosupport handle
+    factory = None
+    if geosupport is None:
+        from geosupport import Geosupport
+
+        factory = Geosupport
+
+    suggest = GeosupportSuggest(
+        geosupport,
+        geosupport_factory=factory,
+        func=args.func,
+        max_workers=max(args.workers, 1),
+        pool_size=max(args.workers, args.concurrency, 1),
+        rate_limit=args.rate_limit,
+        use_cache=not args.no_cache,
+        cache_size=args.cache_size,
+        cache_ttl=args.cache_ttl,
+    )
+
+    fmt = args.input_format
+    if fmt == "auto":
+        fmt = "text" if args.input == "-" else _detect_format(args.input)
+
+    in_stream = sys.stdin if args.input == "-" else open(args.input, newline="")
+    out_stream = (
+        sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    )
+    try:
+        records = read_addresses(
+            in_stream,
+            fmt,
+            address_column=args.address_column,
+            borough_column=args.borough_column,
+        )
+        with OutputWriter(out_stream, args.output_format, suggest) as writer:
+            stats = run(
+                suggest,
+                records,
+                writer,
+                parallel=args.workers > 1,
+                progress_every=args.progress,
+                concurrency=args.concurrency,
+            )
+    finally:
+        suggest.close()
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout:
+            out_stream.close()
+
+    if not args.quiet:
+        sys.stderr.write(stats.summary() + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
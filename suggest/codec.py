@@ -0,0 +1,285 @@
+"""Compact binary codec for Geosupport results.
+
+Keys are interned to a fixed schema per Geosupport function, so a record
+stores no key names for schema fields, only an offset table and the packed
+values. Keys outside the schema are kept in a trailing JSON "extras" slot,
+so encoding is lossless. Decoding is lazy: :class:`LazyResult` unpacks the
+offset table and decodes a field only when it is accessed.
+
+Record layout (little endian)::
+
+    u8 version, u8 schema id, u16 slot count n
+    (n + 1) x u32 end offsets into the value blob
+    value blob; slot i is blob[off[i]:off[i + 1]], empty when absent
+
+Each present value starts with a tag byte: ``s`` for UTF-8 text, ``j`` for
+JSON (nested groups, lists, numbers). Schemas are part of the format: never
+reorder or change one, add a new schema id instead. The current AP and 1B
+schemas hold every key Geosupport returns (see :mod:`suggest.layouts`), so
+only keys added by callers end up in extras.
+"""
+
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+import json
+import struct
+
+from .layouts import AP_FIELDS, FUNCTION_1B_FIELDS
+from .suggest import AddressList, AddressResult, BIN_KEYS
+
+CODEC_VERSION = 1
+
+_RECORD_HEADER = struct.Struct("<BBH")
+_COUNT = struct.Struct("<I")
+
+_TEXT = b"s"
+_JSON = b"j"
+
+# Fields shared by the work area 1 output of every address function
+_WA1_FIELDS = (
+    "First Borough Name",
+    "House Number - Display Format",
+    "House Number - Sort Format",
+    "B10SC - First Borough and Street Code",
+    "First Street Name Normalized",
+    "Second Street Name Normalized",
+    "Message",
+    "Message 2",
+    "Geosupport Return Code (GRC)",
+    "Geosupport Return Code 2 (GRC 2)",
+    "Reason Code",
+)
+
+# Fixed schemas by id; 0 interns nothing and keeps every key in extras.
+# 1 and 2 are partial AP and 1B schemas kept to read older records.
+SCHEMAS: Dict[int, Tuple[str, ...]] = {
+    0: (),
+    1: _WA1_FIELDS
+    + (
+        "BOROUGH BLOCK LOT (BBL)",
+        "Number of Existing Structures on Lot",
+        "Condominium Flag",
+        "DOF Condominium Identification Number",
+        "Condominium Billing BBL",
+        "Cooperative ID Number",
+        "Latitude",
+        "Longitude",
+        "X-Y Coordinates of Address Point",
+        "Address Point ID",
+    )
+    + BIN_KEYS,
+    2: _WA1_FIELDS
+    + (
+        "ZIP Code",
+        "BOROUGH BLOCK LOT (BBL)",
+        "Latitude",
+        "Longitude",
+        "Spatial X-Y Coordinates of Address",
+        "COMMUNITY DISTRICT",
+        "Community District Borough Code",
+        "Community District Number",
+        "City Council District",
+        "Police Precinct",
+        "2010 Census Tract",
+        "2010 Census Block",
+        "2020 Census Tract",
+        "2020 Census Block",
+        "Neighborhood Tabulation Area (NTA)",
+        "Low House Number of Block Face",
+        "High House Number of Block Face",
+        "Side of Street Indicator",
+        "Number of Existing Structures on Lot",
+        "Condominium Flag",
+    )
+    + BIN_KEYS,
+    3: AP_FIELDS,
+    4: FUNCTION_1B_FIELDS,
+}
+
+# Schema id used for each Geosupport function
+FUNCTION_SCHEMAS = {"AP": 3, "1B": 4}
+
+_SLOTS: Dict[int, Dict[str, int]] = {
+    schema_id: {name: i for i, name in enumerate(fields)}
+    for schema_id, fields in SCHEMAS.items()
+}
+
+
+def schema_id(func: Optional[str]) -> int:
+    """Return the schema id for a Geosupport function name."""
+    return FUNCTION_SCHEMAS.get(str(func).upper() if func else "", 0)
+
+
+def _encode_value(value: Any) -> bytes:
+    if isinstance(value, str):
+        return _TEXT + value.encode()
+    return _JSON + json.dumps(value, separators=(",", ":")).encode()
+
+
+def _decode_value(data: memoryview) -> Any:
+    tag, body = bytes(data[:1]), data[1:]
+    if tag == _TEXT:
+        return str(body, "utf-8")
+    return json.loads(bytes(body))
+
+
+def encode_result(result: AddressResult, func: Optional[str] = "AP") -> bytes:
+    """Encode one result with the schema for ``func``. None values are dropped."""
+    sid = schema_id(func)
+    fields = SCHEMAS[sid]
+    slots = _SLOTS[sid]
+
+    values: List[bytes] = [b""] * (len(fields) + 1)
+    extras = {}
+    for key, value in result.items():
+        if value is None:
+            continue
+        i = slots.get(key)
+        if i is None:
+            extras[key] = value
+        else:
+            values[i] = _encode_value(value)
+    if extras:
+        values[-1] = _encode_value(extras)
+
+    offsets = [0]
+    for value in values:
+        offsets.append(offsets[-1] + len(value))
+
+    n = len(values)
+    return b"".join(
+        [
+            _RECORD_HEADER.pack(CODEC_VERSION, sid, n),
+            struct.pack(f"<{n + 1}I", *offsets),
+        ]
+        + values
+    )
+
+
+class LazyResult(Mapping):
+    """Read-only result mapping that decodes fields on access."""
+
+    __slots__ = (
+        "_data",
+        "_fields",
+        "_slots",
+        "_offsets",
+        "_base",
+        "_decoded",
+        "_extra",
+    )
+
+    def __init__(self, data: Any):
+        data = memoryview(data)
+        version, sid, n = _RECORD_HEADER.unpack_from(data, 0)
+        if version != CODEC_VERSION or sid not in SCHEMAS:
+            raise ValueError(
+                f"Unsupported result record: version {version}, schema {sid}"
+            )
+
+        self._data = data
+        self._fields = SCHEMAS[sid]
+        self._slots = _SLOTS[sid]
+        self._offsets = struct.unpack_from(f"<{n + 1}I", data, _RECORD_HEADER.size)
+        self._base = _RECORD_HEADER.size + (n + 1) * 4
+        self._decoded: Dict[str, Any] = {}
+        self._extra: Optional[Dict[str, Any]] = None
+
+    def _slot(self, i: int) -> Optional[memoryview]:
+        start, end = self._offsets[i], self._offsets[i + 1]
+        if start == end:
+            return None
+        return self._data[self._base + start : self._base + end]
+
+    def _extras(self) -> Dict[str, Any]:
+        if self._extra is None:
+            data = self._slot(len(self._offsets) - 2)
+            self._extra = _decode_value(data) if data is not None else {}
+        return self._extra
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._decoded:
+            return self._decoded[key]
+
+        i = self._slots.get(key)
+        if i is None:
+            return self._extras()[key]
+
+        data = self._slot(i)
+        if data is None:
+            raise KeyError(key)
+        value = self._decoded[key] = _decode_value(data)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        i = self._slots.get(key)
+        if i is None:
+            return key in self._extras()
+        return self._offsets[i] != self._offsets[i + 1]
+
+    def __iter__(self) -> Iterator[str]:
+        for i, name in enumerate(self._fields):
+            if self._offsets[i] != self._offsets[i + 1]:
+                yield name
+        yield from self._extras()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"LazyResult({self.to_dict()!r})"
+
+    def to_dict(self) -> AddressResult:
+        """Decode every field into a plain dict."""
+        return {key: self[key] for key in self}
+
+
+def decode_result(data: Any) -> LazyResult:
+    """Decode one record lazily."""
+    return LazyResult(data)
+
+
+def encode_results(
+    results: AddressList,
+    func: Optional[str] = "AP",
+    fields: Optional[Sequence[str]] = None,
+) -> bytes:
+    """
+    Encode a list of results.
+
+    Args:
+        results: Geosupport results; None entries are skipped
+        func: Geosupport function whose schema to use ('AP' or '1B')
+        fields: Optional projection; only these keys are kept
+
+    Returns:
+        u32 count, count x u32 record lengths, then the records
+    """
+    records = []
+    for r in results:
+        if r is None:
+            continue
+        if fields is not None:
+            r = {f: r[f] for f in fields if f in r}
+        records.append(encode_result(r, func))
+
+    return b"".join(
+        [
+            _COUNT.pack(len(records)),
+            struct.pack(f"<{len(records)}I", *map(len, records)),
+        ]
+        + records
+    )
+
+
+def decode_results(data: Any) -> List[LazyResult]:
+    """Lazily decode results encoded by :func:`encode_results`."""
+    data = memoryview(data)
+    (count,) = _COUNT.unpack_from(data, 0)
+    lengths = struct.unpack_from(f"<{count}I", data, _COUNT.size)
+
+    results = []
+    offset = _COUNT.size + count * 4
+    for length in lengths:
+        results.append(LazyResult(data[offset : offset + length]))
+        offset += length
+    return results
@@ -0,0 +1,563 @@
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, defaultdict
+import logging
+import math
+import re
+import threading
+
+from .suggest import AddressFormatter, ResultAssembler
+
+logger = logging.getLogger(__name__)
+
+# Size of the character n-grams used for fuzzy matching
+NGRAM_SIZE = 3
+
+_WHITESPACE = re.compile(r"\s+")
+_ORDINAL = re.compile(r"^(\d+)(?:ST|ND|RD|TH)$")
+
+# Street type abbreviations, expanded in the last position
+SUFFIXES = {
+    "ST": "STREET",
+    "AV": "AVENUE",
+    "AVE": "AVENUE",
+    "BLVD": "BOULEVARD",
+    "CT": "COURT",
+    "DR": "DRIVE",
+    "EXPY": "EXPRESSWAY",
+    "HWY": "HIGHWAY",
+    "LN": "LANE",
+    "PKWY": "PARKWAY",
+    "PL": "PLACE",
+    "RD": "ROAD",
+    "SQ": "SQUARE",
+    "TER": "TERRACE",
+}
+
+# Directional abbreviations, expanded in the first position
+DIRECTIONALS = {"N": "NORTH", "S": "SOUTH", "E": "EAST", "W": "WEST"}
+
+
+def normalize_street(street: Optional[str]) -> str:
+    """
+    Normalize a street name for index lookups.
+
+    Uppercases, collapses whitespace, expands a leading directional and a
+    trailing street type (``W 100TH ST`` and ``WEST 100 STREET`` both become
+    ``WEST 100 STREET``) and drops ordinal suffixes from numbers.
+    """
+    if not street:
+        return ""
+    tokens = _WHITESPACE.sub(" ", street.strip().upper()).split(" ")
+    tokens = [_ORDINAL.sub(r"\1", t) for t in tokens]
+    if len(tokens) > 1:
+        tokens[0] = DIRECTIONALS.get(tokens[0], tokens[0])
+        tokens[-1] = SUFFIXES.get(tokens[-1], tokens[-1])
+    return " ".join(tokens)
+
+
+def _ngrams(text: str, n: int = NGRAM_SIZE) -> Set[str]:
+    """Return the set of padded character n-grams for ``text``."""
+    padded = f" {text} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i : i + n] for i in range(len(padded) - n + 1)}
+
+
+class StreetNameIndex:
+    """Thread-safe in-memory street name index per borough.
+
+    Supports prefix lookup (sorted names + bisect) and fuzzy lookup
+    (character n-gram similarity). Boroughs loaded from a full street list
+    are marked complete, which lets ``GeosupportSuggest`` propose candidates
+    without first making a failing Geosupport call.
+    """
+
+    def __init__(self, min_score: float = 0.4):
+        self.min_score = min_score
+        self._names: Dict[int, Dict[str, str]] = defaultdict(dict)
+        self._sorted: Dict[int, List[str]] = {}
+        self._grams: Dict[int, Dict[str, Set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        self._complete: Set[int] = set()
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_file(
+        cls, path: str, borough_code: Optional[int] = None, **kwargs
+    ) -> "StreetNameIndex":
+        """Build an index from a street name file. See :meth:`load`."""
+        index = cls(**kwargs)
+        index.load(path, borough_code=borough_code)
+        return index
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(names) for names in self._names.values())
+
+    def add(self, street: str, borough_code: int) -> None:
+        """Thread-safe add of a single street name."""
+        key = normalize_street(street)
+        if not key:
+            return
+
+        with self._lock:
+            names = self._names[borough_code]
+            if key in names:
+                return
+            names[key] = street
+            self._sorted.pop(borough_code, None)
+            grams = self._grams[borough_code]
+            for gram in _ngrams(key):
+                grams[gram].add(key)
+
+    def add_many(self, streets: Iterable[str], borough_code: int) -> None:
+        """Thread-safe add of several street names for one borough."""
+        with self._lock:
+            for street in streets:
+                self.add(street, borough_code)
+
+    def load(self, path: str, borough_code: Optional[int] = None) -> int:
+        """
+        Load street names from a file and mark their boroughs complete.
+
+        Each line is either a street name (when ``borough_code`` is given) or
+        ``borough_code,street``. Blank lines and lines starting with ``#`` are
+        ignored.
+
+        Args:
+            path: Path to the street name file
+            borough_code: Borough Code (1-5) for every line in the file
+
+        Returns:
+            Number of lines loaded
+
+        Raises:
+            ValueError: If a line has no valid borough code
+        """
+        loaded = 0
+        boroughs = set()
+        with open(path, encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                boro, street = borough_code, line
+                if boro is None:
+                    code, _, street = line.partition(",")
+                    try:
+                        boro = int(code)
+                    except ValueError:
+                        raise ValueError(
+                            f"Line {lineno} of {path}: expected 'borough_code,street'"
+                        )
+
+                self.add(street.strip(), boro)
+                boroughs.add(boro)
+                loaded += 1
+
+        with self._lock:
+            self._complete.update(boroughs)
+        logger.debug(f"Loaded {loaded} street names from {path}")
+        return loaded
+
+    def mark_complete(self, borough_code: int) -> None:
+        """Mark the index as holding every street name for a borough."""
+        with self._lock:
+            self._complete.add(borough_code)
+
+    def is_complete(self, borough_code: Optional[int]) -> bool:
+        """Whether the index holds every street name for a borough."""
+        with self._lock:
+            return borough_code in self._complete
+
+    def contains(self, street: str, borough_code: int) -> bool:
+        """Whether ``street`` is an indexed name in the borough."""
+        with self._lock:
+            return normalize_street(street) in self._names.get(borough_code, {})
+
+    def _sorted_names(self, borough_code: int) -> List[str]:
+        names = self._sorted.get(borough_code)
+        if names is None:
+            names = sorted(self._names.get(borough_code, {}))
+            self._sorted[borough_code] = names
+        return names
+
+    def prefix(self, text: str, borough_code: int, limit: int = 10) -> List[str]:
+        """Return indexed street names starting with ``text``."""
+        key = normalize_street(text)
+        if not key:
+            return []
+
+        with self._lock:
+            names = self._sorted_names(borough_code)
+            display = self._names.get(borough_code, {})
+            matches = []
+            for i in range(bisect_left(names, key), len(names)):
+                if len(matches) >= limit or not names[i].startswith(key):
+                    break
+                matches.append(display[names[i]])
+            return matches
+
+    def fuzzy(
+        self,
+        text: str,
+        borough_code: int,
+        limit: int = 10,
+        min_score: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Return indexed street names similar to ``text``.
+
+        Args:
+            text: Street name to match
+            borough_code: Borough Code (1-5)
+            limit: Maximum number of matches
+            min_score: Minimum n-gram similarity (0-1), defaults to ``self.min_score``
+
+        Returns:
+            List of ``(street, score)`` tuples, best match first
+        """
+        key = normalize_street(text)
+        if not key:
+            return []
+        if min_score is None:
+            min_score = self.min_score
+
+        query = _ngrams(key)
+        with self._lock:
+            grams = self._grams.get(borough_code, {})
+            display = self._names.get(borough_code, {})
+            shared: Dict[str, int] = defaultdict(int)
+            for gram in query:
+                for name in grams.get(gram, ()):
+                    shared[name] += 1
+
+            scored = []
+            for name, count in shared.items():
+                # Dice coefficient over n-gram sets
+                score = 2.0 * count / (len(query) + len(_ngrams(name)))
+                if score >= min_score:
+                    scored.append((display[name], score))
+
+        scored.sort(key=lambda x: (-x[1], x[0]))
+        return scored[:limit]
+
+    def candidates(self, text: str, borough_code: int, limit: int = 5) -> List[str]:
+        """Return up to ``limit`` candidate streets: prefix matches, then fuzzy."""
+        matches = self.prefix(text, borough_code, limit=limit)
+        if len(matches) < limit:
+            for street, _ in self.fuzzy(text, borough_code, limit=limit):
+                if street not in matches:
+                    matches.append(street)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def clear(self) -> None:
+        """Thread-safe clear of all indexed names."""
+        with self._lock:
+            self._names.clear()
+            self._sorted.clear()
+            self._grams.clear()
+            self._complete.clear()
+
+
+# Default spatial grid cell size in degrees (~1km of latitude)
+GRID_CELL_DEGREES = 0.01
+
+_METERS_PER_DEGREE = 111320.0
+
+
+class IndexedResult(NamedTuple):
+    """A Geosupport result with the input address that produced it."""
+
+    input: str
+    result: Dict[str, Any]
+    coordinates: Optional[Dict[str, float]]
+
+
+def _result_bbl(result: Dict[str, Any]) -> Optional[str]:
+    bbl = AddressFormatter.format_bbl(result.get("BOROUGH BLOCK LOT (BBL)"))
+    return bbl.strip() or None if bbl else None
+
+
+def _span(occupied: Set[int], lo: int, hi: int) -> List[int]:
+    """Members of ``occupied`` between ``lo`` and ``hi``, walking the smaller side."""
+    if hi - lo + 1 < len(occupied):
+        return [i for i in range(lo, hi + 1) if i in occupied]
+    return [i for i in occupied if lo <= i <= hi]
+
+
+def _distance_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Equirectangular distance in meters, accurate at city scale."""
+    x = (lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2))
+    y = lat2 - lat1
+    return math.hypot(x, y) * _METERS_PER_DEGREE
+
+
+class ResultIndex:
+    """Thread-safe reverse lookup index over geocoded results.
+
+    Hash indexes on BBL and BIN, and a uniform grid over the coordinates
+    extracted by ``AddressFormatter.format_coordinates``, so lookups by
+    identifier or location do not scan every result. Entries are keyed by
+    input address and result identity, so re-adding a result replaces it,
+    and the least recently added entries are evicted beyond ``max_size``.
+    """
+
+    def __init__(self, cell_degrees: float = GRID_CELL_DEGREES, max_size: int = 10000):
+        self.cell_degrees = cell_degrees
+        self.max_size = max_size
+        # Entry ids in insertion order, oldest first
+        self._entries: Dict[int, IndexedResult] = OrderedDict()
+        self._ids: Dict[Tuple[Any, ...], int] = {}
+        self._next_id = 0
+        # Ordered sets of entry ids
+        self._bbl: Dict[str, Dict[int, None]] = defaultdict(dict)
+        self._bin: Dict[str, Dict[int, None]] = defaultdict(dict)
+        self._grid: Dict[Tuple[int, int], Dict[int, None]] = defaultdict(dict)
+        # Occupied cells by row and by column, and the sorted occupied rows
+        # and columns, so nearest() can skip rings with nothing on them
+        self._rows: Dict[int, Set[int]] = {}
+        self._cols: Dict[int, Set[int]] = {}
+        self._row_keys: List[int] = []
+        self._col_keys: List[int] = []
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return (
+            math.floor(lat / self.cell_degrees),
+            math.floor(lon / self.cell_degrees),
+        )
+
+    @staticmethod
+    def _key(input_address: str, result: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (input_address,) + ResultAssembler.identity(result)
+
+    def add(self, input_address: str, results: Iterable[Dict[str, Any]]) -> None:
+        """Thread-safe add or replace of the results for one input address."""
+        with self._lock:
+            for result in results:
+                if not result:
+                    continue
+                key = self._key(input_address, result)
+                if key in self._ids:
+                    self._remove(self._ids[key])
+                elif len(self._entries) >= self.max_size:
+                    self._remove(next(iter(self._entries)))
+
+                coords = AddressFormatter.format_coordinates(
+                    result.get("Latitude"), result.get("Longitude")
+                )
+                pos = self._next_id
+                self._next_id += 1
+                self._ids[key] = pos
+                self._entries[pos] = IndexedResult(input_address, result, coords)
+
+                bbl = _result_bbl(result)
+                if bbl:
+                    self._bbl[bbl][pos] = None
+                bin_ = AddressFormatter.format_bin(result)
+                if bin_:
+                    self._bin[bin_][pos] = None
+                if coords:
+                    cell = self._cell(coords["latitude"], coords["longitude"])
+                    if cell not in self._grid:
+                        self._occupy(cell)
+                    self._grid[cell][pos] = None
+
+    def _remove(self, pos: int) -> None:
+        """Drop an entry from every index; the caller holds the lock."""
+        entry = self._entries.pop(pos)
+        del self._ids[self._key(entry.input, entry.result)]
+
+        buckets = [
+            (self._bbl, _result_bbl(entry.result)),
+            (self._bin, AddressFormatter.format_bin(entry.result)),
+        ]
+        if entry.coordinates:
+            coords = entry.coordinates
+            buckets.append(
+                (self._grid, self._cell(coords["latitude"], coords["longitude"]))
+            )
+        for index, bucket in buckets:
+            ids = index.get(bucket) if bucket else None
+            if ids is not None:
+                ids.pop(pos, None)
+                if not ids:
+                    del index[bucket]
+                    if index is self._grid:
+                        self._vacate(bucket)
+
+    def _occupy(self, cell: Tuple[int, int]) -> None:
+        """Record a newly occupied grid cell; the caller holds the lock."""
+        row, col = cell
+        for lines, keys, line, other in (
+            (self._rows, self._row_keys, row, col),
+            (self._cols, self._col_keys, col, row),
+        ):
+            if line not in lines:
+                lines[line] = set()
+                insort(keys, line)
+            lines[line].add(other)
+
+    def _vacate(self, cell: Tuple[int, int]) -> None:
+        """Forget a grid cell that no longer holds entries; the caller holds the lock."""
+        row, col = cell
+        for lines, keys, line, other in (
+            (self._rows, self._row_keys, row, col),
+            (self._cols, self._col_keys, col, row),
+        ):
+            lines[line].discard(other)
+            if not lines[line]:
+                del lines[line]
+                del keys[bisect_left(keys, line)]
+
+    def add_batch(
+        self, addresses: Iterable[Any], batch_results: Iterable[List[Dict[str, Any]]]
+    ) -> None:
+        """Add the output of ``GeosupportSuggest.suggestions_batch``."""
+        for address, results in zip(addresses, batch_results):
+            if isinstance(address, dict):
+                address = address.get("address", "")
+            self.add(address, results)
+
+    def by_bbl(self, bbl: str) -> List[IndexedResult]:
+        """Return indexed results for a BBL."""
+        with self._lock:
+            return [self._entries[i] for i in self._bbl.get(str(bbl).strip(), ())]
+
+    def by_bin(self, bin_: str) -> List[IndexedResult]:
+        """Return indexed results for a BIN."""
+        with self._lock:
+            return [self._entries[i] for i in self._bin.get(str(bin_).strip(), ())]
+
+    def within(self, lat: float, lon: float, radius_m: float) -> List[IndexedResult]:
+        """Return indexed results within ``radius_m`` meters, nearest first."""
+        lat_cells = radius_m / _METERS_PER_DEGREE / self.cell_degrees
+        lon_cells = lat_cells / max(math.cos(math.radians(lat)), 1e-6)
+        row, col = self._cell(lat, lon)
+
+        found = []
+        with self._lock:
+            for r in range(row - math.ceil(lat_cells), row + math.ceil(lat_cells) + 1):
+                for c in range(
+                    col - math.ceil(lon_cells), col + math.ceil(lon_cells) + 1
+                ):
+                    for i in self._grid.get((r, c), ()):
+                        entry = self._entries[i]
+                        d = _distance_m(
+                            lat,
+                            lon,
+                            entry.coordinates["latitude"],
+                            entry.coordinates["longitude"],
+                        )
+                        if d <= radius_m:
+                            found.append((d, i))
+
+            found.sort()
+            return [self._entries[i] for _, i in found]
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 1,
+        max_distance_m: Optional[float] = None,
+    ) -> List[Tuple[IndexedResult, float]]:
+        """
+        Return the ``k`` indexed results nearest to a point.
+
+        Searches the occupied cells on the perimeters of growing rings around
+        the point, jumping over rings whose perimeter crosses no occupied row
+        or column, and stops once the next ring cannot hold anything closer
+        than the current k-th match.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            k: Number of results
+            max_distance_m: Ignore results further than this many meters
+
+        Returns:
+            List of ``(IndexedResult, distance_m)`` tuples, nearest first
+        """
+        row, col = self._cell(lat, lon)
+        # Smallest ground distance covered by one ring of cells
+        ring_m = (
+            self.cell_degrees
+            * _METERS_PER_DEGREE
+            * min(1.0, math.cos(math.radians(lat)))
+        )
+
+        found: List[Tuple[float, int]] = []
+        with self._lock:
+            ring = self._next_ring(row, col, -1)
+            while ring is not None:
+                # Anything in this ring is at least ``(ring - 1) * ring_m`` away
+                nearest_m = max(0, ring - 1) * ring_m
+                if max_distance_m is not None and nearest_m > max_distance_m:
+                    break
+                if len(found) >= k and found[-1][0] <= nearest_m:
+                    break
+
+                for cell in self._ring_cells(row, col, ring):
+                    for i in self._grid.get(cell, ()):
+                        coords = self._entries[i].coordinates
+                        d = _distance_m(
+                            lat, lon, coords["latitude"], coords["longitude"]
+                        )
+                        if max_distance_m is None or d <= max_distance_m:
+                            found.append((d, i))
+                found.sort()
+                del found[k:]
+                ring = self._next_ring(row, col, ring)
+
+            return [(self._entries[i], d) for d, i in found]
+
+    def _next_ring(self, row: int, col: int, ring: int) -> Optional[int]:
+        """First ring beyond ``ring`` crossing an occupied row or column."""
+        rings = []
+        for keys, center in ((self._row_keys, row), (self._col_keys, col)):
+            i = bisect_right(keys, center + ring)
+            if i < len(keys):
+                rings.append(keys[i] - center)
+            i = bisect_left(keys, center - ring)
+            if i > 0:
+                rings.append(center - keys[i - 1])
+        return min(rings, default=None)
+
+    def _ring_cells(self, row: int, col: int, ring: int) -> Iterator[Tuple[int, int]]:
+        """Occupied cells on the perimeter of a ring."""
+        if ring == 0:
+            yield row, col
+            return
+
+        for r in (row - ring, row + ring):
+            if r in self._rows:
+                for c in _span(self._rows[r], col - ring, col + ring):
+                    yield r, c
+        for c in (col - ring, col + ring):
+            if c in self._cols:
+                for r in _span(self._cols[c], row - ring + 1, row + ring - 1):
+                    yield r, c
+
+    def clear(self) -> None:
+        """Thread-safe clear of all indexed results."""
+        with self._lock:
+            self._entries.clear()
+            self._ids.clear()
+            self._bbl.clear()
+            self._bin.clear()
+            self._grid.clear()
+            self._rows.clear()
+            self._cols.clear()
+            self._row_keys.clear()
+            self._col_keys.clear()
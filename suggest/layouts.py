@@ -0,0 +1,274 @@
+"""Frozen Geosupport result keys for the codec schemas.
+
+Every top-level key python-geosupport 1.1 returns for a regular-mode call
+(work area 1 followed by work area 2), in the order it returns them. These
+lists are part of the codec format; a newer Geosupport layout gets a new
+list and schema id rather than an edit here.
+"""
+
+from typing import Tuple
+
+# Function AP: 54 keys
+AP_FIELDS: Tuple[str, ...] = (
+    "First Borough Name",
+    "House Number - Display Format",
+    "House Number - Sort Format",
+    "B10SC - First Borough and Street Code",
+    "First Street Name Normalized",
+    "B10SC - Second Borough and Street Code",
+    "Second Street Name Normalized",
+    "B10SC - Third Borough and Street Code",
+    "Third Street Name Normalized",
+    "BOROUGH BLOCK LOT (BBL)",
+    "Filler for Tax Lot Version Number",
+    "Low House Number - Display Format",
+    "Low House Number - Sort Format",
+    "Building Identification Number (BIN)",
+    "Street Attribute Indicators",
+    "Reason Code 2",
+    "Reason Code Qualifier 2",
+    "Warning Code 2",
+    "Geosupport Return Code 2 (GRC 2)",
+    "Message 2",
+    "Node Number",
+    "UNIT - SORT FORMAT",
+    "Unit - Display Format",
+    "NIN",
+    "Street Attribute Indicator",
+    "Reason Code",
+    "Reason Code Qualifier",
+    "Warning Code",
+    "Geosupport Return Code (GRC)",
+    "Message",
+    "Number of Street Codes and Street Names in List",
+    "List of Street Codes",
+    "List of Street Names",
+    "Continuous Parity Indicator /Duplicate Address Indicator",
+    "Low House Number of Defining Address Range",
+    "Number of Existing Structures on Lot",
+    "Reserved for Internal Use",
+    "Building Identification Number (BIN) of Input Address or NAP",
+    "Condominium Flag",
+    "DOF Condominium Identification Number",
+    "Condominium Billing BBL",
+    "Filler - Tax Lot Version No. for Billing BBL",
+    "LOW BBL OF THIS BUILDINGS CONDOMINIUM UNITS",
+    "Filler for Tax Lot Version No. of Low BBL",
+    "HIGH BBL OF THIS BUILDINGS CONDOMINIUM UNITS",
+    "Filler for Tax Lot Version No. of High BBL",
+    "Cooperative ID Number",
+    "Latitude",
+    "Longitude",
+    "X-Y Coordinates of Address Point",
+    "Address Point ID",
+    "List of 4 LGCs - Internal Use",
+    "Number of Entries in List of Geographic Identifiers",
+    "LIST OF GEOGRAPHIC IDENTIFIERS",
+)
+
+# Function 1B: 203 keys
+FUNCTION_1B_FIELDS: Tuple[str, ...] = (
+    "First Borough Name",
+    "House Number - Display Format",
+    "House Number - Sort Format",
+    "B10SC - First Borough and Street Code",
+    "First Street Name Normalized",
+    "B10SC - Second Borough and Street Code",
+    "Second Street Name Normalized",
+    "B10SC - Third Borough and Street Code",
+    "Third Street Name Normalized",
+    "BOROUGH BLOCK LOT (BBL)",
+    "Filler for Tax Lot Version Number",
+    "Low House Number - Display Format",
+    "Low House Number - Sort Format",
+    "Building Identification Number (BIN)",
+    "Street Attribute Indicators",
+    "Reason Code 2",
+    "Reason Code Qualifier 2",
+    "Warning Code 2",
+    "Geosupport Return Code 2 (GRC 2)",
+    "Message 2",
+    "Node Number",
+    "UNIT - SORT FORMAT",
+    "Unit - Display Format",
+    "NIN",
+    "Street Attribute Indicator",
+    "Reason Code",
+    "Reason Code Qualifier",
+    "Warning Code",
+    "Geosupport Return Code (GRC)",
+    "Message",
+    "Number of Street Codes and Street Names in List",
+    "List of Street Codes",
+    "List of Street Names",
+    "Continuous Parity Indicator/Duplicate Address Indicator",
+    "Low House Number of Block Face",
+    "High House Number of Block Face",
+    "DCP Preferred LGC",
+    "Number of Cross Streets at Low Address End",
+    "List of Cross Streets at Low Address End",
+    "Number of Cross Streets at High Address End",
+    "List of Cross Streets at High Address End",
+    "LION KEY",
+    "Special Address Generated Record Flag",
+    "Side of Street Indicator",
+    "Segment Length in Feet",
+    "Spatial X-Y Coordinates of Address",
+    "Reserved for Possible Z Coordinate",
+    "Community Development Eligibility Indicator",
+    "Marble Hill/Rikers Island Alternative Borough Flag",
+    "DOT Street Light Contractor Area",
+    "COMMUNITY DISTRICT",
+    "ZIP Code",
+    "Election District",
+    "Assembly District",
+    "Split Election District Flag",
+    "Congressional District",
+    "State Senatorial District",
+    "Civil Court District",
+    "City Council District",
+    "Health Center District",
+    "Health Area",
+    "Sanitation District",
+    "Sanitation Collection Scheduling Section and Subsection",
+    "Sanitation Regular Collection Schedule",
+    "Sanitation Recycling Collection Schedule",
+    "Police Patrol Borough Command",
+    "Police Precinct",
+    "Fire Division",
+    "Fire Battalion",
+    "Fire Company Type",
+    "Fire Company Number",
+    "Community School District",
+    "Atomic Polygon",
+    "Police Patrol Borough",
+    "Feature Type Code",
+    "Segment Type Code",
+    "Alley or Cross Street List Flag",
+    "Coincidence Segment Count",
+    "1990 Census Tract",
+    "2010 Census Tract",
+    "2010 Census Block",
+    "2010 Census Block Suffix",
+    "2000 Census Tract",
+    "2000 Census Block",
+    "2000 Census Block Suffix",
+    "Neighborhood Tabulation Area (NTA)",
+    "DSNY Snow Priority Code",
+    "DSNY Organic Recycling Schedule",
+    "DSNY Bulk Pickup Schedule",
+    "Hurricane Evacuation Zone (HEZ)",
+    "Underlying Address Number for NAPs",
+    "Underlying B7SC",
+    "Segment Identifier",
+    "Curve Flag",
+    "List of 4 LGCs",
+    "BOE LGC Pointer",
+    "Segment Azimuth",
+    "Segment Orientation",
+    "SPATIAL COORDINATES OF SEGMENT",
+    "SPATIAL COORDINATES OF CENTER OF CURVATURE",
+    "Radius of Circle",
+    "Secant Location Related to Curve",
+    "Angle to From Node - Beta Value",
+    "Angle to To Node - Alpha Value",
+    "From LION Node ID",
+    "To LION Node ID",
+    "LION Key for Vanity Address",
+    "Side of Street of Vanity Address",
+    "Split Low House Number",
+    "Traffic Direction",
+    "Turn Restrictions",
+    "Fraction for Curve Calculation",
+    "Roadway Type",
+    "Physical ID",
+    "Generic ID",
+    "NYPD ID",
+    "FDNY ID",
+    "Bike Lane 2",
+    "Bike Traffic Direction",
+    "Street Status",
+    "Street Width",
+    "Street Width Irregular",
+    "Bike Lane",
+    "Federal Classification Code",
+    "Right Of Way Type",
+    "List of Second Set of 5 LGCs",
+    "Legacy Segment ID",
+    "From Preferred LGCs First Set of 5",
+    "To Preferred LGCs First Set of 5",
+    "From Preferred LGCs Second Set of 5",
+    "To Preferred LGCs Second Set of 5",
+    "No Cross Street Calculation Flag",
+    "Individual Segment Length",
+    "NTA Name",
+    "USPS Preferred City Name",
+    "Latitude",
+    "Longitude",
+    "From Actual Segment Node ID",
+    "To Actual Segment Node ID",
+    "SPATIAL COORDINATES OF ACTUAL SEGMENT",
+    "Blockface ID",
+    "Number of Travel Lanes on the Street",
+    "Number of Parking Lanes on the Street",
+    "Number of Total Lanes on the Street",
+    "Street Width Maximum",
+    "Speed Limit",
+    "PUMA Code",
+    "Police Sector",
+    "Police Service Area",
+    "Truck Route Type",
+    "2020 Census Tract",
+    "2020 Census Block",
+    "2020 Census Block Suffix",
+    "2020 Neighborhood Tabulation Area (NTA)",
+    "2020 Community District Tabulation Area (CDTA)",
+    "Filler",
+    "Return Code",
+    "No. of Cross Streets at High Address End",
+    "List of Cross Street Names at Low Address End",
+    "List of Cross Street Names at High Address End",
+    "BOE Preferred B7SC",
+    "BOE Preferred Street Name",
+    "Continuous Parity Indicator / Duplicate Address Indicator",
+    "Low House Number of Defining Address Range",
+    "RPAD Self-Check Code (SCC) for BBL",
+    "RPAD Building Classification Code",
+    "Corner Code",
+    "Number of Existing Structures on Lot",
+    "Number of Street Frontages of Lot",
+    "Interior Lot Flag",
+    "Vacant Lot Flag",
+    "Irregularly-Shaped Lot Flag",
+    "Marble Hill/Rikers Island Alternate Borough Flag",
+    "List of Geographic Identifiers Overflow Flag",
+    "STROLLING KEY",
+    "Building Identification Number (BIN) of Input Address or NAP",
+    "Condominium Flag",
+    "DOF Condominium Identification Number",
+    "Condominium Unit ID Number",
+    "Condominium Billing BBL",
+    "Filler - Tax Lot Version No. Billing BBL",
+    "Self-Check Code (SCC) of Billing BBL",
+    "Low BBL of this Building's Condominium Units",
+    "Filler - Tax Lot Version No. of Low BBL",
+    "High BBL of this Building's Condominium Units",
+    "Filler - Tax Log Version No. of High BBL",
+    "Cooperative ID Number",
+    "SBVP (SANBORN MAP IDENTIFIER)",
+    "DCP Commercial Study Area",
+    "Tax Map Number Section & Volume",
+    "Reserved for Tax Map Page Number",
+    "X-Y Coordinates of Lot Centroid",
+    "X Coordinate",
+    "Y Coordinate",
+    "Business Improvement District (BID)",
+    "TPAD BIN Status",
+    "TPAD New BIN",
+    "TPAD New BIN Status",
+    "TPAD Conflict Flag",
+    "DCP Zoning Map",
+    "Internal Use",
+    "Number of Entries in List of Geographic Identifiers",
+    "LIST OF GEOGRAPHIC IDENTIFIERS",
+)
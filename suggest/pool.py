@@ -0,0 +1,161 @@
+"""Pool of Geosupport handles for thread-parallel execution.
+
+Geosupport work areas are not meant to be shared between concurrent calls,
+so parallel workers each check out their own handle from a
+:class:`GeosupportPool`. Handles are created on demand by a factory callable,
+up to the pool size, and handles that fail a health check or raise an
+unexpected error are discarded and replaced.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class GeosupportPool:
+    """
+    Thread-safe pool of at most ``size`` Geosupport handles.
+
+    ``checkout()`` hands out an idle handle, creates one if the pool is not
+    full, or waits for one to be returned.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 3,
+        health_check: Optional[Callable[[Any], bool]] = None,
+        expected_errors: Tuple[Type[BaseException], ...] = (),
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            factory: Callable returning a new Geosupport handle
+            size: Maximum number of handles
+            health_check: Called with an idle handle before it is handed out;
+                a falsy result or an exception discards the handle
+            expected_errors: Exceptions raised by normal calls (such as
+                GeosupportError) that do not discard the handle
+            timeout: Seconds to wait for a handle before raising TimeoutError
+                (None waits forever)
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+
+        self.factory = factory
+        self.size = size
+        self.health_check = health_check
+        self.expected_errors = expected_errors
+        self.timeout = timeout
+
+        self._idle: List[Any] = []
+        self._count = 0
+        self._cond = threading.Condition()
+        self.created = 0
+        self.discarded = 0
+
+    def _healthy(self, handle: Any) -> bool:
+        if self.health_check is None:
+            return True
+        try:
+            return bool(self.health_check(handle))
+        except Exception as e:
+            logger.warning(f"Geosupport handle health check failed: {e}")
+            return False
+
+    def acquire(self) -> Any:
+        """Check out a handle; return it with :meth:`release`."""
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            with self._cond:
+                while not self._idle and self._count >= self.size:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(
+                            f"No Geosupport handle available after {self.timeout}s"
+                        )
+                    self._cond.wait(remaining)
+
+                if self._idle:
+                    handle = self._idle.pop()
+                else:
+                    # Reserve the slot; the handle is created outside the lock
+                    self._count += 1
+                    handle = None
+
+            if handle is None:
+                try:
+                    handle = self.factory()
+                except BaseException:
+                    self._forget()
+                    raise
+                with self._cond:
+                    self.created += 1
+                return handle
+
+            if self._healthy(handle):
+                return handle
+            self.discard(handle)
+
+    def release(self, handle: Any) -> None:
+        """Return a checked-out handle to the pool."""
+        with self._cond:
+            self._idle.append(handle)
+            self._cond.notify()
+
+    def discard(self, handle: Any) -> None:
+        """Drop a checked-out handle; a new one is created when needed."""
+        logger.debug("Discarding Geosupport handle")
+        with self._cond:
+            self.discarded += 1
+        self._forget()
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._count -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def checkout(self):
+        """
+        Context manager holding a handle for one call.
+
+        The handle is discarded if the block raises anything other than
+        ``expected_errors``.
+        """
+        handle = self.acquire()
+        try:
+            yield handle
+        except self.expected_errors:
+            self.release(handle)
+            raise
+        except BaseException:
+            self.discard(handle)
+            raise
+        else:
+            self.release(handle)
+
+    def close(self) -> None:
+        """Drop idle handles; new ones are created on demand."""
+        with self._cond:
+            self._count -= len(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        """Thread-safe snapshot of pool usage."""
+        with self._cond:
+            return {
+                "size": self.size,
+                "handles": self._count,
+                "idle": len(self._idle),
+                "in_use": self._count - len(self._idle),
+                "created": self.created,
+                "discarded": self.discarded,
+            }
@@ -0,0 +1,160 @@
+"""Priority-aware admission of Geosupport calls.
+
+Share one :class:`PriorityScheduler` between the ``GeosupportSuggest``
+instances that use a Geosupport host. Waiting calls are admitted in priority
+order (interactive before batch), each class has its own concurrency limit,
+and a class whose queue is too deep has new work rejected with
+:class:`SchedulerOverloaded` instead of adding to everyone's latency.
+"""
+
+from bisect import insort
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, Dict, Optional
+import threading
+import time
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+
+class SchedulerOverloaded(RuntimeError):
+    """Raised when a priority class's queue is full."""
+
+
+class PriorityScheduler:
+    """
+    Thread-safe priority scheduler with per-class concurrency limits.
+
+    Lower priority values run first; within a class calls run in arrival
+    order. A waiting call is admitted when a global slot is free, its class
+    is under its own limit and no earlier-ranked waiter could take the slot.
+    Keeping the batch limit below ``max_concurrent`` reserves headroom for
+    interactive calls while batches run.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        limits: Optional[Dict[str, int]] = None,
+        max_queue: Optional[Dict[str, Optional[int]]] = None,
+        priorities: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Args:
+            max_concurrent: Maximum calls running at once across classes
+            limits: Maximum running calls per class; batch defaults to half
+                of ``max_concurrent``
+            max_queue: Maximum waiting calls per class before new calls that
+                cannot run at once are rejected (None for unbounded); batch
+                defaults to 100
+            priorities: Priority per class, lower runs first
+        """
+        self.max_concurrent = max_concurrent
+        self.priorities = {INTERACTIVE: 0, BATCH: 1}
+        self.priorities.update(priorities or {})
+        self.limits = {cls: max_concurrent for cls in self.priorities}
+        self.limits[BATCH] = max(1, max_concurrent // 2)
+        self.limits.update(limits or {})
+        self.max_queue: Dict[str, Optional[int]] = {BATCH: 100}
+        self.max_queue.update(max_queue or {})
+
+        self._cond = threading.Condition()
+        self._seq = count()
+        self._waiting: list = []  # sorted (priority, seq, cls)
+        self._queued: Dict[str, int] = defaultdict(int)
+        self._running: Dict[str, int] = defaultdict(int)
+        self._total = 0
+        self._admitted: Dict[str, int] = defaultdict(int)
+        self._rejected: Dict[str, int] = defaultdict(int)
+        self._wait_s: Dict[str, float] = defaultdict(float)
+
+    def _runnable(self, entry) -> bool:
+        """Whether ``entry`` is the first waiter that may take a free slot."""
+        if self._total >= self.max_concurrent:
+            return False
+        for waiter in self._waiting:
+            if self._running[waiter[2]] < self.limits[waiter[2]]:
+                return waiter is entry
+        return False
+
+    def acquire(self, cls: str = INTERACTIVE) -> float:
+        """
+        Wait for a slot for a call of class ``cls``. Returns seconds waited.
+
+        Raises:
+            ValueError: If ``cls`` is not a known class
+            SchedulerOverloaded: If the call would wait and the class's
+                queue is full
+        """
+        if cls not in self.priorities:
+            raise ValueError(f"Unknown priority class: {cls}")
+
+        started = time.perf_counter()
+        with self._cond:
+            entry = (self.priorities[cls], next(self._seq), cls)
+            insort(self._waiting, entry)
+            # Only calls that would have to wait are shed
+            limit = self.max_queue.get(cls)
+            if (
+                limit is not None
+                and self._queued[cls] >= limit
+                and not self._runnable(entry)
+            ):
+                self._waiting.remove(entry)
+                self._rejected[cls] += 1
+                raise SchedulerOverloaded(
+                    f"{cls} queue is full ({self._queued[cls]} waiting)"
+                )
+
+            self._queued[cls] += 1
+            try:
+                while not self._runnable(entry):
+                    self._cond.wait()
+            finally:
+                self._waiting.remove(entry)
+                self._queued[cls] -= 1
+
+            self._running[cls] += 1
+            self._total += 1
+            self._admitted[cls] += 1
+            waited = time.perf_counter() - started
+            self._wait_s[cls] += waited
+            # Another waiter may be admissible too
+            self._cond.notify_all()
+        return waited
+
+    def release(self, cls: str = INTERACTIVE) -> None:
+        """Release a slot taken by :meth:`acquire`."""
+        with self._cond:
+            self._running[cls] -= 1
+            self._total -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, cls: str = INTERACTIVE):
+        """Context manager holding a slot for one call; yields seconds waited."""
+        waited = self.acquire(cls)
+        try:
+            yield waited
+        finally:
+            self.release(cls)
+
+    def stats(self) -> Dict[str, Any]:
+        """Thread-safe snapshot of per-class queue and admission counts."""
+        with self._cond:
+            return {
+                cls: {
+                    "running": self._running[cls],
+                    "waiting": self._queued[cls],
+                    "admitted": self._admitted[cls],
+                    "rejected": self._rejected[cls],
+                    "avg_wait_ms": (
+                        self._wait_s[cls] / self._admitted[cls] * 1000
+                        if self._admitted[cls]
+                        else 0.0
+                    ),
+                }
+                for cls in self.priorities
+            }
@@ -0,0 +1,448 @@
+"""Lightweight HTTP suggestion service with micro-batching.
+
+Endpoints:
+
+* ``GET /suggest?address=...&borough_code=1&format=normalized``
+* ``POST /batch`` with a JSON list of addresses (strings or
+  ``{"address": ..., "borough_code": ...}``), or ``{"addresses": [...]}``;
+  these run in the scheduler's batch class so they yield to ``/suggest``
+* ``GET /stats``
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+import argparse
+import json
+import logging
+import queue
+import threading
+import time
+
+from .scheduler import BATCH, INTERACTIVE, PriorityScheduler, SchedulerOverloaded
+from .suggest import AddressList, GeosupportSuggest
+
+logger = logging.getLogger(__name__)
+
+RESULT_FORMATS = ("normalized", "geojson", "raw")
+
+# Number of recent request latencies kept for percentiles
+LATENCY_WINDOW = 1000
+
+# Seconds a handler waits for its results before answering 504
+REQUEST_TIMEOUT = 60.0
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Collect concurrent requests into deduplicated batches.
+
+    A dispatcher thread groups requests arriving within ``batch_window``
+    seconds of each other, and identical inputs (including ones already in
+    flight) are geocoded once, with every waiter receiving the shared result.
+    Distinct inputs run concurrently on one executor of ``workers`` threads
+    shared by all connections; each task uses a fork of the
+    ``GeosupportSuggest`` instance, so they share its caches, handle pool and
+    scheduler, and runs in the priority class it was submitted with.
+    """
+
+    def __init__(
+        self,
+        suggest: GeosupportSuggest,
+        batch_window: float = 0.005,
+        max_batch: int = 64,
+        parallel: bool = True,
+        workers: Optional[int] = None,
+    ):
+        self.suggest = suggest
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.parallel = parallel
+        self.requests = 0
+        self.batches = 0
+        self.calls = 0
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self._inflight: Dict[Tuple[str, Any, str], List[Tuple[Future, float]]] = {}
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers or suggest.max_workers,
+            thread_name_prefix="suggest-worker",
+        )
+        self._thread = threading.Thread(
+            target=self._loop, name="suggest-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        address: str,
+        borough_code: Optional[int] = None,
+        priority: str = INTERACTIVE,
+    ) -> Future:
+        """
+        Queue an address and return a Future for its results.
+
+        ``priority`` is the scheduler class its Geosupport calls run under;
+        identical inputs are only shared within the same class.
+        """
+        future: Future = Future()
+        self._queue.put((address, borough_code, priority, future, time.perf_counter()))
+        return future
+
+    def close(self) -> None:
+        """Stop the dispatcher thread after the queued requests are served."""
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _loop(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = time.perf_counter() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                # Keep dispatching; only this batch's callers see the error
+                logger.exception("Failed to dispatch batch")
+                for _, _, _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _run_batch(self, batch: List[Tuple[str, Any, str, Future, float]]) -> None:
+        """Dispatch each distinct input in ``batch`` once to the executor."""
+        started_calls = []
+        with self._lock:
+            self.requests += len(batch)
+            self.batches += 1
+            for address, borough_code, priority, future, started in batch:
+                if not isinstance(address, str):
+                    future.set_exception(
+                        ValueError(f"Address must be a string, got {address!r}")
+                    )
+                    continue
+                key = (" ".join(address.upper().split()), borough_code, priority)
+                waiters = self._inflight.get(key)
+                if waiters is None:
+                    waiters = self._inflight[key] = []
+                    started_calls.append(key)
+                waiters.append((future, started))
+            self.calls += len(started_calls)
+
+        for key in started_calls:
+            self._executor.submit(self._run_one, key)
+        logger.debug(
+            f"Dispatched batch of {len(batch)} requests, {len(started_calls)} new"
+        )
+
+    def _run_one(self, key: Tuple[str, Any, str]) -> None:
+        """Geocode one distinct input and resolve everyone waiting on it."""
+        address, borough_code, priority = key
+        try:
+            worker = self.suggest.fork()
+            worker.priority = priority
+            results = list(
+                worker.suggestions(
+                    address, borough_code=borough_code, parallel=self.parallel
+                )
+            )
+            error = None
+        except Exception as e:
+            error = e
+
+        with self._lock:
+            waiters = self._inflight.pop(key)
+            done = time.perf_counter()
+            self._latencies.extend(done - started for _, started in waiters)
+
+        for future, _ in waiters:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(results)
+
+    def stats(self) -> Dict[str, Any]:
+        """Thread-safe snapshot of batching and latency statistics."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                "requests": self.requests,
+                "batches": self.batches,
+                "calls": self.calls,
+                "deduplicated": self.requests - self.calls,
+            }
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        stats["latency_ms"] = {
+            "p50": percentile(0.50),
+            "p90": percentile(0.90),
+            "p99": percentile(0.99),
+            "max": latencies[-1] * 1000 if latencies else None,
+        }
+        return stats
+
+
+class SuggestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the suggestion endpoints."""
+
+    server: "SuggestHTTPServer"
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: int, body: Any) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _format(self, results: AddressList, fmt: str) -> Any:
+        suggest = self.server.batcher.suggest
+        if fmt == "geojson":
+            return suggest.to_geojson(results)
+        if fmt == "raw":
+            # Plain dicts for JSON, e.g. lazily decoded shared store results
+            return [dict(r) for r in results]
+        return suggest.normalize_results(results)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/stats":
+            self._send_json(200, self.server.stats())
+            return
+        if url.path != "/suggest":
+            self._send_json(404, {"error": f"Unknown path: {url.path}"})
+            return
+
+        try:
+            fmt = _result_format(params.get("format"))
+            address = params.get("address")
+            if not address:
+                raise ValueError("Missing 'address' parameter")
+            borough_code = _borough(params.get("borough_code"))
+            future = self.server.batcher.submit(address, borough_code)
+            results = future.result(timeout=REQUEST_TIMEOUT)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except FutureTimeoutError:
+            self._send_json(504, {"error": "Timed out waiting for results"})
+            return
+        except SchedulerOverloaded as e:
+            self._send_json(503, {"error": str(e)})
+            return
+        except Exception as e:
+            logger.exception(f"Error serving {address!r}")
+            self._send_json(500, {"error": str(e)})
+            return
+
+        self._send_json(200, {"input": address, "results": self._format(results, fmt)})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/batch":
+            self._send_json(404, {"error": f"Unknown path: {url.path}"})
+            return
+
+        try:
+            fmt = _result_format(parse_qs(url.query).get("format", [None])[-1])
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"null")
+            if isinstance(body, dict):
+                body = body.get("addresses")
+            if not isinstance(body, list):
+                raise ValueError("Expected a JSON list of addresses")
+
+            items = []
+            for i, entry in enumerate(body):
+                if isinstance(entry, dict):
+                    address = entry.get("address") or ""
+                    borough_code = _borough(entry.get("borough_code"))
+                else:
+                    address, borough_code = entry, None
+                if not isinstance(address, str):
+                    raise ValueError(f"Entry {i}: address must be a string")
+                items.append((address, borough_code))
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        futures = [self.server.batcher.submit(a, b, BATCH) for a, b in items]
+        deadline = time.monotonic() + REQUEST_TIMEOUT
+        response = []
+        for (address, _), future in zip(items, futures):
+            try:
+                results = future.result(timeout=max(0, deadline - time.monotonic()))
+                record = {"input": address, "results": self._format(results, fmt)}
+            except FutureTimeoutError:
+                record = {"input": address, "error": "Timed out waiting for results"}
+            except Exception as e:
+                record = {"input": address, "error": str(e)}
+            response.append(record)
+        self._send_json(200, {"results": response})
+
+
+def _borough(value: Any) -> Optional[int]:
+    """Parse an optional borough code from request input."""
+    if value in (None, ""):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid borough code: {value}")
+
+
+def _result_format(value: Optional[str]) -> str:
+    """Validate the requested result format."""
+    fmt = value or "normalized"
+    if fmt not in RESULT_FORMATS:
+        raise ValueError(f"Invalid format: {fmt}. Must be one of {RESULT_FORMATS}")
+    return fmt
+
+
+class SuggestHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server sharing one MicroBatcher across connections."""
+
+    daemon_threads = True
+
+    def __init__(self, server_address, batcher: MicroBatcher):
+        super().__init__(server_address, SuggestHandler)
+        self.batcher = batcher
+
+    def stats(self) -> Dict[str, Any]:
+        """Batching, latency, cache, scheduler and handle pool statistics."""
+        stats = self.batcher.stats()
+        suggest = self.batcher.suggest
+        for name in ("cache", "negative_cache", "scheduler", "pool"):
+            component = getattr(suggest, name)
+            stats[name] = component.stats() if component is not None else None
+        return stats
+
+    def server_close(self):
+        super().server_close()
+        self.batcher.close()
+
+
+def make_server(
+    suggest: GeosupportSuggest,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    batch_window: float = 0.005,
+    max_batch: int = 64,
+    parallel: bool = True,
+    workers: Optional[int] = None,
+) -> SuggestHTTPServer:
+    """
+    Create a suggestion server around a GeosupportSuggest instance.
+
+    Args:
+        suggest: GeosupportSuggest shared by all connections
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        batch_window: Seconds to wait for more requests before dispatching a batch
+        max_batch: Maximum requests per batch
+        parallel: Whether to use parallel processing for each address
+        workers: Addresses geocoded concurrently across all connections,
+            defaults to ``suggest.max_workers``
+
+    Returns:
+        SuggestHTTPServer; call ``serve_forever()`` to start it
+    """
+    batcher = MicroBatcher(
+        suggest,
+        batch_window=batch_window,
+        max_batch=max_batch,
+        parallel=parallel,
+        workers=workers,
+    )
+    return SuggestHTTPServer((host, port), batcher)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the suggestion server: ``python -m suggest.server``."""
+    p = argparse.ArgumentParser(description="Geosupport suggestion HTTP server.")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8080)
+    p.add_argument("--func", default="AP", help="Geosupport function ('AP' or '1B')")
+    p.add_argument("--workers", type=int, default=5)
+    p.add_argument("--cache-size", type=int, default=10000)
+    p.add_argument("--cache-ttl", type=int, default=3600)
+    p.add_argument("--batch-window-ms", type=float, default=5.0)
+    p.add_argument("--max-batch", type=int, default=64)
+    p.add_argument(
+        "--max-concurrent",
+        type=int,
+        help="Geosupport calls running at once (defaults to --workers)",
+    )
+    p.add_argument(
+        "--batch-limit",
+        type=int,
+        help="Calls /batch may run at once (defaults to half of --max-concurrent)",
+    )
+    args = p.parse_args(argv)
+
+    from geosupport import Geosupport
+
+    scheduler = PriorityScheduler(
+        max_concurrent=args.max_concurrent or args.workers,
+        limits={BATCH: args.batch_limit} if args.batch_limit else None,
+    )
+    suggest = GeosupportSuggest(
+        geosupport_factory=Geosupport,
+        func=args.func,
+        max_workers=args.workers,
+        use_cache=True,
+        cache_size=args.cache_size,
+        cache_ttl=args.cache_ttl,
+        scheduler=scheduler,
+    )
+    server = make_server(
+        suggest,
+        host=args.host,
+        port=args.port,
+        batch_window=args.batch_window_ms / 1000,
+        max_batch=args.max_batch,
+        parallel=args.workers > 1,
+    )
+    logger.info(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
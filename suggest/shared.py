@@ -0,0 +1,283 @@
+"""Read-only shared result store for multi-process deployments.
+
+One writer process builds a snapshot file of projected ``suggestions()``
+results and atomically replaces it; every reader process maps the file with
+``mmap`` and binary searches its sorted key table in place, decoding only the
+record it needs. Put the file on a tmpfs such as ``/dev/shm`` to keep it in
+shared memory. Replacing a mapped file requires a POSIX platform.
+
+File layout (little endian)::
+
+    header   MAGIC, version, metadata length, record count, index offset
+    metadata JSON with the Geosupport function and projected field names
+    records  result lists encoded with :mod:`suggest.codec`
+    index    count x (16-byte key, u64 offset, u32 length), sorted by key
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+
+from .codec import LazyResult, decode_results, encode_results
+from .suggest import AddressList, BIN_KEYS, ThreadSafeMemoryCache
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"GSSTORE1"
+VERSION = 2
+
+_HEADER = struct.Struct("<8sIIQQ")
+_ENTRY = struct.Struct("<16sQI")
+
+# Fields kept for each result; enough for format_address, normalize_results
+# and to_geojson
+DEFAULT_FIELDS: Tuple[str, ...] = (
+    "First Borough Name",
+    "House Number - Display Format",
+    "First Street Name Normalized",
+    "ZIP Code",
+    "Latitude",
+    "Longitude",
+    "BOROUGH BLOCK LOT (BBL)",
+) + BIN_KEYS
+
+
+def _key_bytes(key: str) -> bytes:
+    """Convert a cache key (md5 hex digest) to its 16 raw bytes."""
+    return bytes.fromhex(key)
+
+
+class SharedResultWriter:
+    """
+    Build and publish a shared result store snapshot.
+
+    Collect results with :meth:`add` or :meth:`add_cache`, then call
+    :meth:`commit` to atomically replace the store file. Each commit writes
+    everything added so far.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        func: str = "AP",
+        fields: Optional[Sequence[str]] = DEFAULT_FIELDS,
+    ):
+        self.path = path
+        self.func = func
+        self.fields = tuple(fields) if fields is not None else None
+        self._records: Dict[bytes, bytes] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    def add(self, key: str, results: AddressList) -> None:
+        """Add the results stored under a cache key."""
+        data = encode_results(results, self.func, self.fields)
+        with self._lock:
+            self._records[_key_bytes(key)] = data
+
+    def add_cache(self, cache: ThreadSafeMemoryCache) -> int:
+        """Add every unexpired entry of a cache. Returns the number added."""
+        items = cache.items()
+        for key, results in items:
+            self.add(key, results)
+        return len(items)
+
+    def commit(self) -> int:
+        """Write a new snapshot and atomically replace the store file."""
+        with self._lock:
+            records = sorted(self._records.items())
+
+        schema = json.dumps({"func": self.func, "fields": self.fields}).encode()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".gsstore-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, len(schema), 0, 0))
+                f.write(schema)
+
+                entries = []
+                offset = _HEADER.size + len(schema)
+                for key, data in records:
+                    f.write(data)
+                    entries.append(_ENTRY.pack(key, offset, len(data)))
+                    offset += len(data)
+
+                f.write(b"".join(entries))
+                f.seek(0)
+                f.write(_HEADER.pack(MAGIC, VERSION, len(schema), len(records), offset))
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+        logger.debug(f"Published {len(records)} results to {self.path}")
+        return len(records)
+
+
+class _Snapshot:
+    """A mapped store file. Raises ValueError if it is not a complete store."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.identity = (st.st_ino, st.st_mtime_ns, st.st_size)
+        try:
+            self._read_header(path)
+        except BaseException:
+            self.buf.close()
+            raise
+
+    def _read_header(self, path: str) -> None:
+        if len(self.buf) < _HEADER.size:
+            raise ValueError(f"{path} is too short to be a shared result store")
+        magic, version, schema_len, self.count, self.index_offset = _HEADER.unpack_from(
+            self.buf, 0
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a shared result store")
+
+        # Records lie between the metadata and the key table
+        self.records_offset = _HEADER.size + schema_len
+        index_end = self.index_offset + self.count * _ENTRY.size
+        if not self.records_offset <= self.index_offset <= index_end <= len(self.buf):
+            raise ValueError(f"{path} is truncated or corrupt")
+        self.metadata = json.loads(self.buf[_HEADER.size : self.records_offset])
+        if not isinstance(self.metadata, dict):
+            raise ValueError(f"{path} has invalid metadata")
+
+    def find(self, key: bytes) -> Optional[memoryview]:
+        """Binary search the key table; return the record bytes in place."""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry_key, offset, length = _ENTRY.unpack_from(
+                self.buf, self.index_offset + mid * _ENTRY.size
+            )
+            if entry_key < key:
+                lo = mid + 1
+            elif entry_key > key:
+                hi = mid
+            elif self.records_offset <= offset <= offset + length <= self.index_offset:
+                return memoryview(self.buf)[offset : offset + length]
+            else:
+                logger.warning(
+                    f"Skipping corrupt shared result store entry {key.hex()}"
+                )
+                return None
+        return None
+
+
+class SharedResultStore:
+    """
+    Read-only view of a shared result store file.
+
+    Safe to share between threads. The file is re-checked at most every
+    ``refresh_interval`` seconds and remapped when the writer publishes a new
+    snapshot. A missing file behaves like an empty store.
+    """
+
+    def __init__(self, path: str, refresh_interval: float = 1.0):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.hits = 0
+        self.misses = 0
+        self._snapshot: Optional[_Snapshot] = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def __len__(self) -> int:
+        snapshot = self._current()
+        return snapshot.count if snapshot else 0
+
+    def refresh(self) -> bool:
+        """Remap the store file if it changed. Returns True if remapped."""
+        with self._lock:
+            self._checked = time.monotonic()
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                return False
+
+            current = self._snapshot
+            if current and current.identity == (
+                st.st_ino,
+                st.st_mtime_ns,
+                st.st_size,
+            ):
+                return False
+
+            try:
+                # Readers still using the old snapshot keep it mapped until
+                # they drop their reference
+                self._snapshot = _Snapshot(self.path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not map shared result store: {e}")
+                return False
+            return True
+
+    def _current(self) -> Optional[_Snapshot]:
+        if time.monotonic() - self._checked >= self.refresh_interval:
+            self.refresh()
+        return self._snapshot
+
+    @property
+    def func(self) -> Optional[str]:
+        """Geosupport function of the current snapshot, None if there is none."""
+        snapshot = self._current()
+        return snapshot.metadata.get("func") if snapshot else None
+
+    def matches(self, func: Optional[str]) -> bool:
+        """Whether the current snapshot can serve ``func`` (True when empty)."""
+        stored = self.func
+        return stored is None or func is None or stored.upper() == func.upper()
+
+    def get(self, key: str, func: Optional[str] = None) -> Optional[List[LazyResult]]:
+        """
+        Return the projected results stored under a cache key.
+
+        Results are read-only mappings decoded lazily from the mapped file.
+        Cache keys do not include the Geosupport function, so pass ``func``
+        to treat a snapshot written for another function as a miss.
+        """
+        snapshot = self._current()
+        data = None
+        if snapshot and (
+            func is None
+            or str(snapshot.metadata.get("func", "")).upper() == func.upper()
+        ):
+            data = snapshot.find(_key_bytes(key))
+
+        results = None
+        if data is not None:
+            try:
+                results = decode_results(data)
+            except (struct.error, ValueError) as e:
+                logger.warning(f"Skipping corrupt shared result store record: {e}")
+        with self._lock:
+            if results is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Store size and hit counts."""
+        size = len(self)
+        with self._lock:
+            return {"size": size, "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        """Drop the mapping; it is unmapped once no reader holds it."""
+        with self._lock:
+            self._snapshot = None
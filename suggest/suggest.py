@@ -1,22 +1,49 @@
-from geosupport import GeosupportError
-from nycparser import Parser
-from typing import List, Dict, Any, Optional, Union, Tuple, TypeVar
-import concurrent.futures
+from typing import List, Dict, Any, Optional, Union, Tuple, TypeVar, TYPE_CHECKING
+import copy
 import logging
 import time
 import hashlib
 from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
 import threading
 
+from .scheduler import BATCH, INTERACTIVE, SchedulerOverloaded
+from .trace import NULL_SPAN, Tracer
+
+if TYPE_CHECKING:
+    from .index import ResultIndex, StreetNameIndex
+    from .pool import GeosupportPool
+    from .scheduler import PriorityScheduler
+    from .shared import SharedResultStore
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Initialize parser
-parser = Parser()
+# Shared default parser, created on first use (see get_default_parser)
+_default_parser = None
+_parser_lock = threading.Lock()
 
 # Valid borough codes
 VALID_BOROUGH_CODES = {1, 2, 3, 4, 5}
 
+# Result relevance ranks, best first
+EXACT_MATCH = 0
+SIMILAR_NAME = 1
+FUZZY_MATCH = 2
+
+# Backoff in seconds for batch calls shed by a PriorityScheduler, and the
+# number of attempts before the rejection is raised
+BATCH_RETRY_DELAY = 0.05
+BATCH_RETRY_MAX_DELAY = 2.0
+BATCH_RETRY_ATTEMPTS = 10
+
+# Result keys holding the BIN, in order of preference
+BIN_KEYS = (
+    "Building Identification Number (BIN) of Input Address or NAP",
+    "Building Identification Number (BIN)",
+)
+
 # Type variables for better generic typing
 T = TypeVar("T")
 K = TypeVar("K")
@@ -30,6 +57,32 @@ NormalizedAddress = Dict[str, Any]
 CoordinatePair = Tuple[float, float]
 
 
+def get_default_parser():
+    """Return the shared default nyc-parser ``Parser``, creating it on first use."""
+    global _default_parser
+    if _default_parser is None:
+        with _parser_lock:
+            if _default_parser is None:
+                from nycparser import Parser
+
+                _default_parser = Parser()
+    return _default_parser
+
+
+def __getattr__(name):
+    # ``parser`` used to be a module-level Parser; keep it importable
+    if name == "parser":
+        return get_default_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def make_cache_key(*args, **kwargs) -> str:
+    """Generate a unique key for function arguments."""
+    key_parts = [str(args), str(sorted(kwargs.items()))]
+    key_str = "".join(key_parts)
+    return hashlib.md5(key_str.encode()).hexdigest()
+
+
 class ThreadSafeMemoryCache:
     """Thread-safe in-memory LRU cache with TTL."""
 
@@ -37,27 +90,30 @@ class ThreadSafeMemoryCache:
         self.max_size = max_size
         self.ttl = ttl_seconds
         self.cache: Dict[str, Tuple[Any, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
         self._lock = threading.RLock()  # Reentrant lock for thread safety
 
     def _get_key(self, *args, **kwargs) -> str:
         """Generate a unique key for the function arguments."""
-        key_parts = [str(args), str(sorted(kwargs.items()))]
-        key_str = "".join(key_parts)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        return make_cache_key(*args, **kwargs)
 
     def get(self, key: str) -> Optional[Any]:
         """Thread-safe get from cache."""
         with self._lock:
             if key not in self.cache:
+                self.misses += 1
                 return None
 
             value, expiry = self.cache[key]
 
             if time.time() > expiry:
                 del self.cache[key]
+                self.misses += 1
                 return None
 
             self.cache.move_to_end(key)
+            self.hits += 1
             return value
 
     def set(self, key: str, value: Any) -> None:
@@ -75,11 +131,27 @@ class ThreadSafeMemoryCache:
 
             self.cache[key] = (value, expiry)
 
+    def items(self) -> List[Tuple[str, Any]]:
+        """Thread-safe snapshot of unexpired ``(key, value)`` pairs, oldest first."""
+        with self._lock:
+            now = time.time()
+            return [(k, v) for k, (v, exp) in self.cache.items() if exp >= now]
+
     def clear(self) -> None:
         """Thread-safe clear cache."""
         with self._lock:
             self.cache.clear()
 
+    def stats(self) -> Dict[str, int]:
+        """Thread-safe snapshot of cache size and hit counts."""
+        with self._lock:
+            return {
+                "size": len(self.cache),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
     def remove_expired(self) -> int:
         """Thread-safe removal of expired items."""
         with self._lock:
@@ -91,32 +163,66 @@ class ThreadSafeMemoryCache:
 
 
 # Function decorator for caching
-def cached_method(cache_instance):
-    """Decorator to cache method results."""
+def cached_method(cache_instance, negative_cache_instance=None):
+    """
+    Decorator to cache method results.
+
+    Empty results go to the negative cache instead, when one is configured,
+    so they get their own TTL and size budget.
+    """
 
     def decorator(func):
+        @wraps(func)
         def wrapper(self, *args, **kwargs):
             # Only use cache if it's enabled
-            if not hasattr(self, "use_cache") or not self.use_cache:
-                return func(self, *args, **kwargs)
+            cache = None
+            if getattr(self, "use_cache", False):
+                cache = getattr(self, cache_instance)
+
+            negative_cache = None
+            if negative_cache_instance:
+                negative_cache = getattr(self, negative_cache_instance, None)
 
-            cache = getattr(self, cache_instance)
-            if cache is None:
+            # Read-only shared store, consulted after the local cache
+            store = getattr(self, "shared_store", None)
+            if cache is None and store is None and negative_cache is None:
                 return func(self, *args, **kwargs)
 
             # Generate cache key
-            key = cache._get_key(*args, **kwargs)
+            key = make_cache_key(*args, **kwargs)
+            span = self._span
 
             # Try to get from cache
-            cached_result = cache.get(key)
-            if cached_result is not None:
-                return cached_result
+            if cache is not None:
+                with span.child("cache.get") as s:
+                    cached_result = cache.get(key)
+                    s.set(hit=cached_result is not None)
+                if cached_result is not None:
+                    return cached_result
+
+            if negative_cache is not None:
+                with span.child("negative_cache.get") as s:
+                    negative_result = negative_cache.get(key)
+                    s.set(hit=negative_result is not None)
+                if negative_result is not None:
+                    return negative_result
+
+            # Shared results are not copied into the local cache
+            if store is not None:
+                with span.child("shared_store.get") as s:
+                    shared_result = store.get(key, func=self.geofunction)
+                    s.set(hit=shared_result is not None)
+                if shared_result is not None:
+                    return shared_result
 
             # If not in cache, call the function
             result = func(self, *args, **kwargs)
 
             # Cache the result
-            cache.set(key, result)
+            if not result and negative_cache is not None:
+                negative_cache.set(key, result)
+            elif cache is not None:
+                cache.set(key, result)
             return result
 
         return wrapper
@@ -124,6 +230,29 @@ def cached_method(cache_instance):
     return decorator
 
 
+def traced_method(func):
+    """Decorator recording a root span per call when the instance has a tracer."""
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        tracer = self.tracer
+        if tracer is None:
+            return func(self, *args, **kwargs)
+
+        attributes = {f"arg.{i}": a for i, a in enumerate(args)}
+        attributes.update((f"arg.{k}", v) for k, v in kwargs.items())
+        with tracer.start(func.__name__, **attributes) as span:
+            self._span = span
+            try:
+                result = func(self, *args, **kwargs)
+                span.set(results=len(result))
+                return result
+            finally:
+                self._span = NULL_SPAN
+
+    return wrapper
+
+
 class AddressFormatter:
     """Consistent formatting for address components."""
 
@@ -144,6 +273,20 @@ class AddressFormatter:
             return bbl_data.get("BOROUGH BLOCK LOT (BBL)")
         return str(bbl_data)
 
+    @staticmethod
+    def format_bin(result: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Extract BIN from a result, whichever work area key holds it."""
+        if not result:
+            return None
+
+        for key in BIN_KEYS:
+            value = result.get(key)
+            if isinstance(value, dict):
+                value = value.get(key)
+            if value and str(value).strip():
+                return str(value).strip()
+        return None
+
     @staticmethod
     def format_coordinates(
         lat: Optional[Union[str, float]], lon: Optional[Union[str, float]]
@@ -158,6 +301,88 @@ class AddressFormatter:
             return None
 
 
+class _SharedExecutor:
+    """Thread pool created on first use and shared by an instance and its forks."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="geosupport-suggest",
+                    )
+        return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+class ResultAssembler:
+    """
+    Thread-safe, single-pass assembly of suggestion results.
+
+    Results are bucketed by relevance rank and borough as they arrive and
+    deduplicated by BBL/BIN plus normalized street, so the final list is
+    ranked (exact match, similar name, fuzzy match; then borough name)
+    without filtering or sorting the collected results.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[int, Dict[str, AddressList]] = {}
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._seen)
+
+    @staticmethod
+    def identity(result: AddressResult) -> Tuple[Any, ...]:
+        """Stable identity of a result: BBL, BIN, normalized street and borough."""
+        street = result.get("First Street Name Normalized") or ""
+        return (
+            AddressFormatter.format_bbl(result.get("BOROUGH BLOCK LOT (BBL)")),
+            AddressFormatter.format_bin(result),
+            " ".join(street.upper().split()),
+            AddressFormatter.format_borough(result.get("First Borough Name")),
+        )
+
+    def add(self, result: Optional[AddressResult], rank: int = EXACT_MATCH) -> bool:
+        """Thread-safe add of a result. Returns False for None or duplicates."""
+        if result is None:
+            return False
+
+        key = self.identity(result)
+        borough = result.get("First Borough Name", "")
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            self._buckets.setdefault(rank, {}).setdefault(borough, []).append(result)
+            return True
+
+    def results(self) -> AddressList:
+        """Return the deduplicated results in rank order."""
+        with self._lock:
+            ordered = []
+            for rank in sorted(self._buckets):
+                boroughs = self._buckets[rank]
+                for borough in sorted(boroughs):
+                    ordered.extend(boroughs[borough])
+            return ordered
+
+
 class GeosupportSuggest:
     """Provides address suggestions from NYC Geosupport."""
 
@@ -171,6 +396,19 @@ class GeosupportSuggest:
         use_cache=False,
         cache_size=1000,
         cache_ttl=3600,
+        use_negative_cache=False,
+        negative_cache_size=1000,
+        negative_cache_ttl=300,
+        street_index: Optional["StreetNameIndex"] = None,
+        street_index_top_k=5,
+        result_index: Optional["ResultIndex"] = None,
+        shared_store: Optional["SharedResultStore"] = None,
+        trace=False,
+        scheduler: Optional["PriorityScheduler"] = None,
+        priority=INTERACTIVE,
+        geosupport_factory=None,
+        pool_size=None,
+        pool_health_check=None,
     ):
         """
         Initialize GeosupportSuggest.
@@ -184,20 +422,74 @@ class GeosupportSuggest:
             use_cache: Enable caching of results
             cache_size: Maximum number of items in memory cache
             cache_ttl: Time-to-live in seconds for cached items
+            use_negative_cache: Cache empty results and SIMILAR NAMES lists
+                separately from the result cache
+            negative_cache_size: Maximum number of items in the negative cache
+            negative_cache_ttl: Time-to-live in seconds for negative items
+            street_index: StreetNameIndex used to propose candidate streets
+                and learn from SIMILAR NAMES responses
+            street_index_top_k: Max candidate streets sent to Geosupport
+                for a street missing from a complete borough index
+            result_index: ResultIndex updated with every new set of results
+            shared_store: Read-only SharedResultStore checked after the cache
+            trace: Record a span tree for every suggestions() call in
+                ``self.tracer`` (True, or a Tracer to share)
+            scheduler: PriorityScheduler admitting each Geosupport call;
+                share one between instances using the same Geosupport host
+            priority: Scheduler class of this instance's calls
+                ('interactive' or 'batch')
+            geosupport_factory: Callable returning a new Geosupport object;
+                calls then use a pool of handles, one per concurrent worker,
+                instead of ``geosupport``
+            pool_size: Maximum pooled handles (defaults to max_workers)
+            pool_health_check: Called with an idle pooled handle before
+                reuse; a falsy result replaces the handle
         """
         self._g = geosupport
+        self.pool: Optional["GeosupportPool"] = None
+        if geosupport_factory is not None:
+            from geosupport import GeosupportError
+
+            from .pool import GeosupportPool
+
+            self.pool = GeosupportPool(
+                geosupport_factory,
+                size=pool_size or max_workers,
+                health_check=pool_health_check,
+                expected_errors=(GeosupportError,),
+            )
         self.geofunction = func
         self.results = []
         self.similar_names = []
+        self._assembler = ResultAssembler()
         self.max_workers = max_workers
         self.rate_limit = rate_limit
         self.last_call_time = 0
+        self._rate_lock = threading.Lock()
+        # Worker pool for parallel calls, shared with forks
+        self._executor = _SharedExecutor(max_workers)
+        self.street_index = street_index
+        self.street_index_top_k = street_index_top_k
+        self.result_index = result_index
+        self.shared_store = shared_store
+        if shared_store is not None and not shared_store.matches(func):
+            logger.warning(
+                f"Shared result store {shared_store.path} holds "
+                f"{shared_store.func} results; they are skipped for {func}"
+            )
+        self.scheduler = scheduler
+        self.priority = priority
 
-        # Initialize parser with custom options if provided
-        if parser_options:
-            self.parser = Parser(**parser_options)
+        # Tracing is off unless requested; NULL_SPAN makes spans no-ops
+        if isinstance(trace, Tracer):
+            self.tracer = trace
         else:
-            self.parser = parser
+            self.tracer = Tracer() if trace else None
+        self._span = NULL_SPAN
+
+        # Parser is created lazily on first use
+        self._parser = None
+        self._parser_options = parser_options
 
         # Initialize cache
         self.use_cache = use_cache
@@ -208,80 +500,224 @@ class GeosupportSuggest:
         else:
             self.cache = None
 
-        if self._g is None:
+        # Negative cache: empty results and per-street SIMILAR NAMES lists
+        if use_negative_cache:
+            self.negative_cache = ThreadSafeMemoryCache(
+                max_size=negative_cache_size, ttl_seconds=negative_cache_ttl
+            )
+        else:
+            self.negative_cache = None
+
+        if self._g is None and self.pool is None:
             raise ValueError(
-                "You must initialize GeosupportSuggest with a Geosupport object."
+                "You must initialize GeosupportSuggest with a Geosupport object "
+                "or a geosupport_factory."
             )
 
+    @property
+    def parser(self):
+        """nyc-parser ``Parser``, custom if ``parser_options`` were given."""
+        if self._parser is None:
+            if self._parser_options:
+                from nycparser import Parser
+
+                self._parser = Parser(**self._parser_options)
+            else:
+                self._parser = get_default_parser()
+        return self._parser
+
+    @parser.setter
+    def parser(self, value):
+        self._parser = value
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.clear()
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool used for parallel calls."""
+        self._executor.shutdown()
+
+    def fork(self) -> "GeosupportSuggest":
+        """
+        Return an instance for running suggestions() on another thread.
+
+        The fork shares configuration, caches, indexes, shared store, tracer,
+        handle pool, scheduler, rate limit and the worker pool used for
+        parallel calls with this instance, but keeps its own per-call state
+        (results, similar names, current span).
+        """
+        other = copy.copy(self)
+        other.results = []
+        other.similar_names = []
+        other._assembler = ResultAssembler()
+        other._span = NULL_SPAN
+        # Calls from every fork count against this instance's rate limit
+        other._respect_rate_limit = self._respect_rate_limit
+        return other
 
     def clear(self):
         """Clear all results and similar names."""
         self.results = []
         self.similar_names = []
+        self._assembler = ResultAssembler()
 
     def _respect_rate_limit(self):
-        """Implement rate limiting if enabled."""
-        if self.rate_limit > 0:
-            elapsed = time.time() - self.last_call_time
-            if elapsed < self.rate_limit:
-                time.sleep(self.rate_limit - elapsed)
-            self.last_call_time = time.time()
-
-    def _geocode(self, phn, street, borough_code=None, zip=None):
+        """Implement rate limiting if enabled. Returns seconds waited."""
+        if self.rate_limit <= 0:
+            return 0
+        # Reserve the next call slot under the lock, then sleep outside it,
+        # so concurrent workers and forks are spaced out too
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self.last_call_time + self.rate_limit)
+            self.last_call_time = slot
+        waited = slot - now
+        if waited > 0:
+            time.sleep(waited)
+        return waited
+
+    def _geocode(self, phn, street, borough_code=None, zip=None, rank=EXACT_MATCH):
         """Geocode or attempt to geocode an address."""
-        self._respect_rate_limit()
-        logger.debug(f"Geocoding: {phn} {street} (Borough: {borough_code}, ZIP: {zip})")
+        from geosupport import GeosupportError
+
+        with self._span.child(
+            "geocode",
+            phn=phn,
+            street=street,
+            borough_code=borough_code,
+            zip=zip,
+            rank=rank,
+        ) as span:
+            # Validate borough code
+            if borough_code and borough_code not in VALID_BOROUGH_CODES:
+                logger.warning(f"Invalid borough code: {borough_code}")
+                span.set(outcome="invalid_borough")
+                return
 
-        # Validate borough code
-        if borough_code and borough_code not in VALID_BOROUGH_CODES:
-            logger.warning(f"Invalid borough code: {borough_code}")
-            return
+            # SIMILAR NAMES depends on the street, not the house number
+            similar_key = None
+            if self.negative_cache is not None:
+                similar_key = "similar:" + make_cache_key(
+                    self.geofunction, street, borough_code, zip
+                )
+                names = self.negative_cache.get(similar_key)
+                if names is not None:
+                    self._add_similar_names(names, borough_code)
+                    span.set(
+                        outcome="similar_names", similar_names=len(names), cached=True
+                    )
+                    return
 
-        try:
-            r = self._g[self.geofunction](
-                house_number=phn, street=street, borough_code=borough_code, zip=zip
-            )
-            self.results.append(r)
+            waited = self._respect_rate_limit()
+            if waited:
+                span.set(rate_limit_wait_ms=waited * 1000)
             logger.debug(
-                f"Found result: {r.get('First Borough Name', 'Unknown')} - "
-                f"{r.get('First Street Name Normalized', 'Unknown')}"
+                f"Geocoding: {phn} {street} (Borough: {borough_code}, ZIP: {zip})"
             )
-        except GeosupportError as ge:
-            if "SIMILAR NAMES" in ge.result.get("Message", ""):
-                list_of_street_names = ge.result.get("List of Street Names", [])
-                r = [
-                    {"street": s, "borough_code": borough_code}
-                    for s in list_of_street_names
-                ]
-                self.similar_names.extend(r)
-                logger.debug(f"Found {len(list_of_street_names)} similar names")
-            else:
-                logger.warning(f"Geocoding error: {ge}")
 
-    def _geocode_parallel(self, items):
-        """Geocode multiple items in parallel."""
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.max_workers
-        ) as executor:
-            futures = []
-            for item in items:
-                futures.append(
-                    executor.submit(
-                        self._geocode,
-                        item.get("phn"),
-                        item.get("street"),
-                        item.get("borough_code"),
-                        item.get("zip"),
-                    )
+            try:
+                r = self._call_geosupport(
+                    span,
+                    house_number=phn,
+                    street=street,
+                    borough_code=borough_code,
+                    zip=zip,
+                )
+                if not self._assembler.add(r, rank):
+                    span.set(outcome="no_result" if r is None else "duplicate")
+                    return
+                span.set(outcome="result")
+                logger.debug(
+                    f"Found result: {r.get('First Borough Name', 'Unknown')} - "
+                    f"{r.get('First Street Name Normalized', 'Unknown')}"
                 )
-            concurrent.futures.wait(futures)
+            except GeosupportError as ge:
+                if "SIMILAR NAMES" in ge.result.get("Message", ""):
+                    list_of_street_names = ge.result.get("List of Street Names", [])
+                    self._add_similar_names(list_of_street_names, borough_code)
+                    if similar_key is not None:
+                        self.negative_cache.set(similar_key, list_of_street_names)
+                    if self.street_index is not None and borough_code:
+                        self.street_index.add_many(list_of_street_names, borough_code)
+                    span.set(
+                        outcome="similar_names", similar_names=len(list_of_street_names)
+                    )
+                    logger.debug(f"Found {len(list_of_street_names)} similar names")
+                else:
+                    span.set(outcome="error", message=str(ge))
+                    logger.warning(f"Geocoding error: {ge}")
+
+    def _call_geosupport(self, span, **kwargs):
+        """Call the Geosupport function, admitted by the scheduler if set."""
+        if self.scheduler is None:
+            return self._run_geosupport(**kwargs)
+
+        with self.scheduler.slot(self.priority) as waited:
+            if waited:
+                span.set(priority=self.priority, queue_wait_ms=waited * 1000)
+            return self._run_geosupport(**kwargs)
+
+    def _run_geosupport(self, **kwargs):
+        """Run the Geosupport function on a pooled handle if pooling is on."""
+        if self.pool is None:
+            return self._g[self.geofunction](**kwargs)
+
+        with self.pool.checkout() as g:
+            return g[self.geofunction](**kwargs)
+
+    def _add_similar_names(self, names, borough_code):
+        """Queue similar street names to try in a borough."""
+        self.similar_names.extend(
+            [
+                {"street": s, "borough_code": borough_code, "rank": SIMILAR_NAME}
+                for s in names
+            ]
+        )
+
+    @contextmanager
+    def _phase(self, name, **attributes):
+        """Trace a phase of suggestions(); nested calls become its children."""
+        parent = self._span
+        if not parent:
+            yield parent
+            return
+
+        with parent.child(name, **attributes) as span:
+            self._span = span
+            try:
+                yield span
+            finally:
+                self._span = parent
+
+    def _geocode_parallel(self, items):
+        """Geocode multiple items in parallel on the shared worker pool."""
+        import concurrent.futures
+
+        executor = self._executor.get()
+        futures = [
+            executor.submit(
+                self._geocode,
+                item.get("phn"),
+                item.get("street"),
+                item.get("borough_code"),
+                item.get("zip"),
+                item.get("rank", EXACT_MATCH),
+            )
+            for item in items
+        ]
+        concurrent.futures.wait(futures)
+
+        # Shed load: a rejected call fails the whole request
+        for future in futures:
+            if isinstance(future.exception(), SchedulerOverloaded):
+                raise future.exception()
 
-    @cached_method("cache")
+    @traced_method
+    @cached_method("cache", "negative_cache")
     def suggestions(
         self,
         input_address: str,
@@ -302,7 +738,10 @@ class GeosupportSuggest:
         Raises:
             ValueError: If borough_code is invalid
         """
-        parsed = self.parser.address(input_address)
+        with self._phase("parse") as span:
+            parsed = self.parser.address(input_address)
+            if span:
+                span.set(**{f"parsed.{k}": v for k, v in parsed.items() if v})
         if borough_code:
             if borough_code not in VALID_BOROUGH_CODES:
                 raise ValueError(
@@ -312,17 +751,22 @@ class GeosupportSuggest:
 
         self.similar_names = []
         self.results = []
+        self._assembler = ResultAssembler()
 
         if not parsed.get("PHN") or not parsed.get("STREET"):
             logger.warning("No house number or street found in input")
             return self.results
 
-        self._process_address_with_location_info(parsed, parallel)
-        self._process_similar_names(parsed, parallel)
+        with self._phase("location", parallel=parallel):
+            self._process_address_with_location_info(parsed, parallel)
+        if self.similar_names:
+            with self._phase("similar_names", count=len(self.similar_names)):
+                self._process_similar_names(parsed, parallel)
 
-        # Filter None values and sort results
-        self.results = [r for r in self.results if r is not None]
-        self.results.sort(key=lambda x: x.get("First Borough Name", ""))
+        # Deduplicated and ranked as results arrived
+        self.results = self._assembler.results()
+        if self.result_index is not None:
+            self.result_index.add(input_address, self.results)
         return self.results
 
     def _process_address_with_location_info(self, parsed, parallel):
@@ -330,6 +774,8 @@ class GeosupportSuggest:
         if not parsed.get("BOROUGH_CODE") and not parsed.get("ZIP"):
             self._process_all_boroughs(parsed, parallel)
         elif parsed.get("BOROUGH_CODE"):
+            if self._queue_index_candidates(parsed, parsed["BOROUGH_CODE"]):
+                return
             self._geocode(
                 phn=parsed["PHN"],
                 street=parsed["STREET"],
@@ -338,8 +784,37 @@ class GeosupportSuggest:
         elif parsed.get("ZIP"):
             self._geocode(phn=parsed["PHN"], street=parsed["STREET"], zip=parsed["ZIP"])
 
+    def _queue_index_candidates(self, parsed, borough_code):
+        """
+        Queue street index candidates in place of a likely failing call.
+
+        Only applies to boroughs the index holds completely. Returns True if
+        the street was handled by the index and needs no Geosupport call.
+        """
+        index = self.street_index
+        if index is None or not index.is_complete(borough_code):
+            return False
+        if index.contains(parsed["STREET"], borough_code):
+            return False
+
+        candidates = index.candidates(
+            parsed["STREET"], borough_code, limit=self.street_index_top_k
+        )
+        self.similar_names.extend(
+            {"street": s, "borough_code": borough_code, "rank": FUZZY_MATCH}
+            for s in candidates
+        )
+        logger.debug(
+            f"Street index proposed {len(candidates)} candidates for "
+            f"{parsed['STREET']} (Borough: {borough_code})"
+        )
+        return True
+
     def _process_all_boroughs(self, parsed, parallel):
         """Try the address in all five boroughs."""
+        boroughs = [
+            x for x in range(1, 6) if not self._queue_index_candidates(parsed, x)
+        ]
         if parallel:
             items = [
                 {
@@ -347,11 +822,11 @@ class GeosupportSuggest:
                     "street": parsed["STREET"],
                     "borough_code": x,
                 }
-                for x in range(1, 6)
+                for x in boroughs
             ]
             self._geocode_parallel(items)
         else:
-            for x in range(1, 6):
+            for x in boroughs:
                 self._geocode(
                     phn=parsed["PHN"], street=parsed["STREET"], borough_code=x
                 )
@@ -367,6 +842,7 @@ class GeosupportSuggest:
                     "phn": parsed["PHN"],
                     "street": name["street"],
                     "borough_code": name["borough_code"],
+                    "rank": name.get("rank", SIMILAR_NAME),
                 }
                 for name in self.similar_names
             ]
@@ -377,10 +853,22 @@ class GeosupportSuggest:
                     phn=parsed["PHN"],
                     street=name["street"],
                     borough_code=name["borough_code"],
+                    rank=name.get("rank", SIMILAR_NAME),
                 )
 
-    def suggestions_batch(self, addresses, parallel=False):
-        """Process multiple addresses in batch."""
+    def suggestions_batch(self, addresses, parallel=False, priority=BATCH):
+        """
+        Process multiple addresses in batch.
+
+        Geosupport calls run under the ``priority`` scheduler class, so a
+        shared scheduler lets interactive callers go first. An address whose
+        calls are shed by the scheduler is deferred and retried with backoff,
+        up to ``BATCH_RETRY_ATTEMPTS`` times before SchedulerOverloaded is
+        raised. The batch runs on a :meth:`fork`, so
+        ``self.priority`` is never changed.
+        """
+        worker = self.fork()
+        worker.priority = priority
         all_results = []
         for address in addresses:
             if isinstance(address, dict):
@@ -390,8 +878,22 @@ class GeosupportSuggest:
                 addr_str = address
                 boro = None
 
-            results = self.suggestions(addr_str, borough_code=boro, parallel=parallel)
+            delay = BATCH_RETRY_DELAY
+            for attempt in range(1, BATCH_RETRY_ATTEMPTS + 1):
+                try:
+                    results = worker.suggestions(
+                        addr_str, borough_code=boro, parallel=parallel
+                    )
+                    break
+                except SchedulerOverloaded:
+                    if attempt == BATCH_RETRY_ATTEMPTS:
+                        raise
+                    logger.debug(f"Scheduler overloaded, retrying in {delay:.2f}s")
+                    time.sleep(delay)
+                    delay = min(delay * 2, BATCH_RETRY_MAX_DELAY)
             all_results.append(results)
+
+        self.results, self.similar_names = worker.results, worker.similar_names
         return all_results
 
     def format_address(self, result):
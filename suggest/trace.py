@@ -0,0 +1,227 @@
+"""Opt-in per-request tracing of ``GeosupportSuggest.suggestions()``.
+
+Each traced call produces a span tree: the root ``suggestions`` span, cache
+and shared store lookups, parsing, the borough and similar-name phases, and
+one ``geocode`` span per Geosupport call with its arguments, outcome and any
+rate-limit wait. Traces export as nested JSON or as OpenTelemetry (OTLP/JSON)
+spans.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+import os
+import threading
+import time
+
+# OTLP span kind and status codes
+_SPAN_KIND_INTERNAL = 1
+_STATUS_ERROR = 2
+
+
+class NullSpan:
+    """Span stand-in used when tracing is disabled; every method is a no-op."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def __bool__(self):
+        return False
+
+    def child(self, name: str, **attributes) -> "NullSpan":
+        return self
+
+    def set(self, **attributes) -> None:
+        pass
+
+
+NULL_SPAN = NullSpan()
+
+
+class Span:
+    """A timed operation with attributes and child spans."""
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "error",
+        "children",
+        "_lock",
+        "_on_end",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        on_end=None,
+        **attributes,
+    ):
+        self.name = name
+        self.attributes: Dict[str, Any] = attributes
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self.children: List["Span"] = []
+        self._lock = threading.Lock()
+        self._on_end = on_end
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_val is not None:
+            self.error = f"{exc_type.__name__}: {exc_val}"
+        self.end()
+        return False
+
+    def child(self, name: str, **attributes) -> "Span":
+        """Start a child span; thread-safe."""
+        span = Span(name, trace_id=self.trace_id, parent_id=self.span_id, **attributes)
+        with self._lock:
+            self.children.append(span)
+        return span
+
+    def set(self, **attributes) -> None:
+        """Set span attributes."""
+        self.attributes.update(attributes)
+
+    def end(self) -> None:
+        """End the span if it is still open."""
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            if self._on_end is not None:
+                self._on_end(self)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Nested JSON-serializable span tree."""
+        with self._lock:
+            children = list(self.children)
+        return {
+            "name": self.name,
+            "start": self.start_ns / 1e9,
+            "duration_ms": self.duration_ms,
+            "attributes": dict(self.attributes),
+            "error": self.error,
+            "children": [c.to_dict() for c in children],
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """Span tree as a JSON string."""
+        import json
+
+        return json.dumps(self.to_dict(), default=str, **kwargs)
+
+    def to_otel(self) -> List[Dict[str, Any]]:
+        """Flatten the tree into OTLP/JSON span dicts."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "kind": _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [
+                {"key": k, "value": _otel_value(v)}
+                for k, v in self.attributes.items()
+                if v is not None
+            ],
+        }
+        if self.error:
+            span["status"] = {"code": _STATUS_ERROR, "message": self.error}
+
+        with self._lock:
+            children = list(self.children)
+        spans = [span]
+        for c in children:
+            spans.extend(c.to_otel())
+        return spans
+
+
+def _otel_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Tracer:
+    """Collects the most recent ``max_traces`` completed root spans."""
+
+    def __init__(self, max_traces: int = 100, service_name: str = "geosupport-suggest"):
+        self.service_name = service_name
+        self.traces: Deque[Span] = deque(maxlen=max_traces)
+        self._lock = threading.Lock()
+
+    def start(self, name: str, **attributes) -> Span:
+        """Start a root span, recorded when it ends."""
+        return Span(name, on_end=self._record, **attributes)
+
+    def _record(self, span: Span) -> None:
+        with self._lock:
+            self.traces.append(span)
+
+    @property
+    def last(self) -> Optional[Span]:
+        """Most recently completed trace."""
+        with self._lock:
+            return self.traces[-1] if self.traces else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self.traces.clear()
+
+    def to_json(self, **kwargs) -> str:
+        """All recorded traces as a JSON list of span trees."""
+        import json
+
+        with self._lock:
+            traces = list(self.traces)
+        return json.dumps([t.to_dict() for t in traces], default=str, **kwargs)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """All recorded traces as an OTLP/JSON ``ExportTraceServiceRequest``."""
+        with self._lock:
+            traces = list(self.traces)
+        spans = [s for t in traces for s in t.to_otel()]
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": self.service_name},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {"scope": {"name": "suggest.trace"}, "spans": spans}
+                    ],
+                }
+            ]
+        }
@@ -72,3 +72,82 @@ class TestSuggestions(TestCase):
         self.assertEqual(result[0]["First Borough Name"], "MANHATTAN")
         self.assertIsNotNone(result[0]["House Number - Display Format"])
         self.assertIsNotNone(result[0]["First Street Name Normalized"])
+
+    def test_results_are_deduplicated(self):
+        # The fixture returns the same Manhattan result for every borough
+        result = self.suggest.suggestions("100 Gold st")
+        self.assertEqual(len(result), 1)
+
+    def test_results_are_ranked(self):
+        mock_geosupport = MagicMock()
+        mock_func = MagicMock()
+        mock_geosupport.__getitem__.return_value = mock_func
+
+        mock_error = GeosupportError({})
+        mock_error.result = {
+            "Message": "SIMILAR NAMES",
+            "List of Street Names": ["GOLD STREET", "GOLD AVENUE"],
+        }
+
+        def mock_geocode(**kwargs):
+            street = kwargs["street"]
+            borough = {1: "MANHATTAN", 3: "BROOKLYN"}.get(kwargs["borough_code"])
+            if street == "GOL" and borough == "MANHATTAN":
+                raise mock_error
+            if borough is None:
+                return None
+            return {
+                "First Borough Name": borough,
+                "House Number - Display Format": "100",
+                "First Street Name Normalized": street,
+            }
+
+        mock_func.side_effect = mock_geocode
+        test_suggest = GeosupportSuggest(mock_geosupport)
+        result = test_suggest.suggestions("100 Gol")
+
+        # Exact match (Brooklyn) ranks ahead of similar names (Manhattan)
+        self.assertEqual(
+            [
+                (r["First Borough Name"], r["First Street Name Normalized"])
+                for r in result
+            ],
+            [
+                ("BROOKLYN", "GOL"),
+                ("MANHATTAN", "GOLD STREET"),
+                ("MANHATTAN", "GOLD AVENUE"),
+            ],
+        )
+
+    def test_rate_limit_shared_by_concurrent_forks(self):
+        """Test concurrent forks are spaced out by the shared rate limit."""
+        import threading
+        import time
+
+        calls = []
+
+        def geocode(**kwargs):
+            calls.append(time.time())
+            return None
+
+        mock_geosupport = MagicMock()
+        mock_geosupport.__getitem__.return_value = MagicMock(side_effect=geocode)
+        s = GeosupportSuggest(mock_geosupport, rate_limit=0.05)
+
+        threads = [
+            threading.Thread(
+                target=s.fork().suggestions,
+                args=(f"{n} Gold St",),
+                kwargs={"borough_code": 1},
+            )
+            for n in range(1, 6)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        calls.sort()
+        self.assertEqual(len(calls), 5)
+        gaps = [b - a for a, b in zip(calls, calls[1:])]
+        self.assertGreaterEqual(min(gaps), 0.04)
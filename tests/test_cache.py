@@ -35,6 +35,24 @@ class TestThreadSafeMemoryCache(unittest.TestCase):
         self.cache.set("key1", "updated_value")
         self.assertEqual(self.cache.get("key1"), "updated_value")
 
+    def test_stats(self):
+        """Test hit and miss counters."""
+        self.cache.set("key1", "value1")
+        self.cache.get("key1")
+        self.cache.get("missing")
+        self.assertEqual(
+            self.cache.stats(), {"size": 1, "max_size": 5, "hits": 1, "misses": 1}
+        )
+
+    def test_items(self):
+        """Test items() snapshots unexpired entries, oldest first."""
+        cache = ThreadSafeMemoryCache(ttl_seconds=0.1)
+        cache.set("old", 1)
+        time.sleep(0.2)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        self.assertEqual(cache.items(), [("key1", "value1"), ("key2", "value2")])
+
     def test_expiration(self):
         """Test that items expire after TTL."""
         cache = ThreadSafeMemoryCache(ttl_seconds=0.1)
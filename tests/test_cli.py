@@ -0,0 +1,144 @@
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from suggest import cli
+
+
+def _mock_geosupport():
+    def mock_geocode(**kwargs):
+        return {
+            "First Borough Name": "MANHATTAN",
+            "House Number - Display Format": kwargs.get("house_number"),
+            "First Street Name Normalized": "GOLD STREET",
+            "Latitude": "40.7",
+            "Longitude": "-74.0",
+        }
+
+    mock_geosupport = MagicMock()
+    mock_geosupport.__getitem__.return_value = MagicMock(side_effect=mock_geocode)
+    return mock_geosupport
+
+
+class TestReadAddresses(unittest.TestCase):
+
+    def test_text(self):
+        """Test one address per line, skipping blanks."""
+        records = list(cli.read_addresses(io.StringIO("100 Gold St\n\n1 Centre St\n")))
+        self.assertEqual(
+            [r["address"] for r in records], ["100 Gold St", "1 Centre St"]
+        )
+
+    def test_csv(self):
+        """Test CSV input with a borough column."""
+        stream = io.StringIO("address,borough_code\n100 Gold St,1\n1 Centre St,\n")
+        records = list(cli.read_addresses(stream, "csv"))
+        self.assertEqual(records[0], {"address": "100 Gold St", "borough_code": 1})
+        self.assertIsNone(records[1]["borough_code"])
+
+    def test_ndjson(self):
+        """Test NDJSON input with objects and bare strings."""
+        stream = io.StringIO(
+            '{"address": "100 Gold St", "borough_code": 1}\n"1 Centre St"\n'
+        )
+        records = list(cli.read_addresses(stream, "ndjson"))
+        self.assertEqual(records[0]["borough_code"], 1)
+        self.assertEqual(records[1]["address"], "1 Centre St")
+
+
+class TestMain(unittest.TestCase):
+
+    def _run(self, argv, stdin=""):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with patch("sys.stdin", io.StringIO(stdin)), patch("sys.stdout", stdout), patch(
+            "sys.stderr", stderr
+        ):
+            code = cli.main(argv, geosupport=_mock_geosupport())
+        self.assertEqual(code, 0)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_normalized_output(self):
+        """Test stdin to NDJSON normalized output with a summary."""
+        out, err = self._run(["--workers", "3"], stdin="100 Gold St\n")
+        record = json.loads(out.splitlines()[0])
+        self.assertEqual(record["input"], "100 Gold St")
+        self.assertEqual(record["results"][0]["street"], "GOLD STREET")
+        self.assertIn("1 addresses, 1 matched", err)
+
+    def test_geojson_output(self):
+        """Test the incrementally written GeoJSON is valid."""
+        out, _ = self._run(
+            ["--output-format", "geojson", "-q"], stdin="100 Gold St\n200 Gold St\n"
+        )
+        geojson = json.loads(out)
+        self.assertEqual(geojson["type"], "FeatureCollection")
+        self.assertEqual(len(geojson["features"]), 2)
+
+    def test_csv_files_and_errors(self):
+        """Test CSV file in, CSV file out, and invalid borough codes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "in.csv")
+            dst = os.path.join(tmp, "out.csv")
+            with open(src, "w") as f:
+                f.write("address,borough_code\n100 Gold St,1\n100 Gold St,9\n")
+
+            _, err = self._run(
+                [src, "-o", dst, "--output-format", "csv", "--progress", "1"]
+            )
+
+            with open(dst) as f:
+                lines = f.read().splitlines()
+        self.assertEqual(lines[0].split(","), cli.CSV_FIELDS)
+        self.assertEqual(len(lines), 2)
+        self.assertIn("1 errors", err)
+
+    def test_malformed_ndjson_lines(self):
+        """Test bad NDJSON records are counted as errors and the run continues."""
+        stdin = '"100 Gold St"\n{not json\n[1, 2]\n{"address": 5}\n"1 Gold St"\n'
+        out, err = self._run(["--input-format", "ndjson"], stdin=stdin)
+
+        records = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[1]["results"], [])
+        self.assertTrue(records[-1]["results"])
+        self.assertIn("3 errors", err)
+
+    def test_concurrency_keeps_input_order(self):
+        """Test concurrent records overlap and are written in input order."""
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def slow_geocode(**kwargs):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            # Earlier addresses take longer, so they finish last
+            time.sleep(0.03 - int(kwargs["house_number"]) * 0.002)
+            with lock:
+                active["now"] -= 1
+            return {
+                "First Borough Name": "MANHATTAN",
+                "House Number - Display Format": kwargs["house_number"],
+                "First Street Name Normalized": "GOLD STREET",
+            }
+
+        geosupport = MagicMock()
+        geosupport.__getitem__.return_value = MagicMock(side_effect=slow_geocode)
+        stdin = "".join(f"{n} Gold St, Manhattan\n" for n in range(1, 11))
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with patch("sys.stdin", io.StringIO(stdin)), patch("sys.stdout", stdout), patch(
+            "sys.stderr", stderr
+        ):
+            cli.main(["--concurrency", "4"], geosupport=geosupport)
+
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([r["input"] for r in records], stdin.strip("\n").split("\n"))
+        self.assertEqual(records[4]["results"][0]["house_number"], "5")
+        self.assertGreater(active["max"], 1)
+        self.assertLessEqual(active["max"], 4)
+        self.assertIn("10 addresses, 10 matched", stderr.getvalue())
@@ -0,0 +1,129 @@
+import json
+import pickle
+import unittest
+from unittest.mock import patch
+
+from geosupport.io import format_input, parse_output
+
+from suggest import codec
+from suggest.codec import (
+    LazyResult,
+    decode_result,
+    decode_results,
+    encode_result,
+    encode_results,
+)
+
+AP_RESULT = {
+    "First Borough Name": "MANHATTAN",
+    "House Number - Display Format": "100",
+    "First Street Name Normalized": "GOLD STREET",
+    "Latitude": "40.7105",
+    "Longitude": "-74.0040",
+    "BOROUGH BLOCK LOT (BBL)": {
+        "BOROUGH BLOCK LOT (BBL)": "1000950001",
+        "Borough Code": "1",
+        "Tax Block": "00095",
+        "Tax Lot": "0001",
+    },
+    "Building Identification Number (BIN) of Input Address or NAP": "1001234",
+    "List of Street Names": [],
+    "Unlisted Field": "kept",
+    "Empty": "",
+    "Missing": None,
+}
+
+
+def _full_result(func):
+    """A complete Geosupport result as python-geosupport parses it."""
+    flags, wa1, wa2 = format_input({"function": func})
+    result = parse_output(flags, wa1, wa2)
+    result.update(
+        {
+            "First Borough Name": "MANHATTAN",
+            "House Number - Display Format": "100",
+            "First Street Name Normalized": "GOLD STREET",
+            "Latitude": "40.7105",
+            "Longitude": "-74.0040",
+            "Message": "",
+        }
+    )
+    return result
+
+
+class TestCodec(unittest.TestCase):
+
+    def test_round_trip(self):
+        """Test every function schema round-trips results losslessly."""
+        expected = {k: v for k, v in AP_RESULT.items() if v is not None}
+        for func in ("AP", "1B", "3S", None):
+            decoded = decode_result(encode_result(AP_RESULT, func))
+            self.assertEqual(decoded.to_dict(), expected)
+            self.assertEqual(dict(decoded), expected)
+
+    def test_mapping_access(self):
+        """Test the lazy result behaves like a read-only dict."""
+        r = decode_result(encode_result(AP_RESULT, "AP"))
+        self.assertEqual(r["First Borough Name"], "MANHATTAN")
+        self.assertEqual(r.get("BOROUGH BLOCK LOT (BBL)", {}).get("Tax Lot"), "0001")
+        self.assertEqual(r["Unlisted Field"], "kept")
+        self.assertEqual(r["Empty"], "")
+        self.assertIn("Latitude", r)
+        self.assertNotIn("ZIP Code", r)
+        self.assertNotIn("Missing", r)
+        self.assertIsNone(r.get("ZIP Code"))
+        with self.assertRaises(KeyError):
+            r["ZIP Code"]
+        self.assertEqual(len(r), len(AP_RESULT) - 1)
+
+    def test_lazy_decoding(self):
+        """Test fields are decoded only when accessed."""
+        r = decode_result(encode_result(AP_RESULT, "AP"))
+        self.assertEqual(r._decoded, {})
+        r["Latitude"]
+        self.assertEqual(list(r._decoded), ["Latitude"])
+        self.assertIsNone(r._extra)
+
+    def test_compact(self):
+        """Test full records are under half the size of pickled or JSON dicts."""
+        for func in ("AP", "1B"):
+            result = _full_result(func)
+            encoded = encode_result(result, func)
+            self.assertLess(len(encoded), len(pickle.dumps(result)) / 2)
+            self.assertLess(len(encoded), len(json.dumps(result)) / 2)
+            self.assertEqual(decode_result(encoded).to_dict(), result)
+
+    def test_schemas_cover_geosupport_keys(self):
+        """Test no Geosupport key falls back to the extras blob."""
+        for func in ("AP", "1B"):
+            r = decode_result(encode_result(_full_result(func), func))
+            self.assertEqual(r["Reason Code"], "")
+            self.assertIn("List of Street Names", r)
+            self.assertIsNone(r._extra)
+            self.assertEqual(r._extras(), {})
+
+    def test_legacy_schema_records(self):
+        """Test records written with the older partial schemas still decode."""
+        with patch.dict(codec.FUNCTION_SCHEMAS, {"AP": 1}):
+            data = encode_result(AP_RESULT, "AP")
+        self.assertEqual(data[1], 1)
+        expected = {k: v for k, v in AP_RESULT.items() if v is not None}
+        self.assertEqual(decode_result(data).to_dict(), expected)
+
+    def test_results_list(self):
+        """Test encoding lists with projection."""
+        data = encode_results(
+            [AP_RESULT, None, AP_RESULT], "AP", fields=["First Borough Name"]
+        )
+        results = decode_results(data)
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[0], LazyResult)
+        self.assertEqual(results[1].to_dict(), {"First Borough Name": "MANHATTAN"})
+        self.assertEqual(decode_results(encode_results([])), [])
+
+    def test_unsupported_record(self):
+        """Test records from unknown versions are rejected."""
+        data = bytearray(encode_result(AP_RESULT, "AP"))
+        data[0] = 99
+        with self.assertRaises(ValueError):
+            decode_result(bytes(data))
@@ -56,3 +56,23 @@ class TestAddressFormatter(unittest.TestCase):
         self.assertIsNone(
             AddressFormatter.format_coordinates("invalid", "also_invalid")
         )
+
+    def test_format_bin(self):
+        """Test extracting BIN from either work area key."""
+        self.assertEqual(
+            AddressFormatter.format_bin(
+                {"Building Identification Number (BIN)": "1001234"}
+            ),
+            "1001234",
+        )
+        self.assertEqual(
+            AddressFormatter.format_bin(
+                {
+                    "Building Identification Number (BIN) of Input Address or NAP": "1000001",
+                    "Building Identification Number (BIN)": "1001234",
+                }
+            ),
+            "1000001",
+        )
+        self.assertIsNone(AddressFormatter.format_bin({}))
+        self.assertIsNone(AddressFormatter.format_bin(None))
@@ -0,0 +1,67 @@
+import subprocess
+import sys
+import unittest
+
+from suggest import suggest as suggest_module
+
+# Cold-start budget for `import suggest`, as a multiple of the stdlib
+# modules it needs, measured in the same interpreter
+IMPORT_BUDGET_RATIO = 2
+BASELINE_MODULES = ("logging", "typing", "hashlib", "threading")
+
+# Modules that must not be loaded just by importing the package
+LAZY_MODULES = ("geosupport", "nycparser", "concurrent.futures")
+
+
+def _importtime(statement):
+    """Run ``statement`` under ``python -X importtime`` and parse the report."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line[len("import time:") :].split("|")
+        try:
+            cumulative[name.strip()] = int(cum)
+        except ValueError:
+            continue  # header line
+    return cumulative
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_heavy_modules_not_imported(self):
+        """Test importing suggest does not load geosupport or the parser."""
+        imported = _importtime("import suggest")
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, imported)
+
+    def test_import_time_budget(self):
+        """Test `import suggest` costs little more than its stdlib imports."""
+        # Best of three runs to keep scheduler noise out of the measurement
+        best, baseline = None, None
+        for _ in range(3):
+            times = _importtime(f"import {', '.join(BASELINE_MODULES)}; import suggest")
+            stdlib = sum(times[m] for m in BASELINE_MODULES)
+            own = times["suggest"]
+            best = own if best is None else min(best, own)
+            baseline = stdlib if baseline is None else min(baseline, stdlib)
+        self.assertLess(best, IMPORT_BUDGET_RATIO * baseline)
+
+    def test_default_parser_is_shared(self):
+        """Test the default parser is created once and shared."""
+        parser = suggest_module.get_default_parser()
+        self.assertIs(parser, suggest_module.get_default_parser())
+
+    def test_module_parser_still_importable(self):
+        """Test the old module-level `parser` name resolves to the default parser."""
+        from suggest.suggest import parser
+
+        self.assertIs(parser, suggest_module.get_default_parser())
+        with self.assertRaises(AttributeError):
+            suggest_module.no_such_name
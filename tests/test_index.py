@@ -0,0 +1,275 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from geosupport import GeosupportError
+
+from suggest import GeosupportSuggest, ResultIndex, StreetNameIndex
+from suggest import index as index_module
+from suggest.index import normalize_street
+
+
+class TestStreetNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = StreetNameIndex()
+        self.index.add_many(
+            ["GOLD STREET", "GOLDEN AVENUE", "BROADWAY", "BROAD STREET"], 1
+        )
+        self.index.add("GOLD STREET", 3)
+
+    def test_len_and_contains(self):
+        """Test that duplicate names are stored once per borough."""
+        self.index.add("gold  street", 1)
+        self.assertEqual(len(self.index), 5)
+        self.assertTrue(self.index.contains("Gold Street", 1))
+        self.assertFalse(self.index.contains("BROADWAY", 3))
+
+    def test_normalize_street(self):
+        """Test abbreviations and ordinals normalize to the full street name."""
+        for street in ("W 100th St", "west 100 street", "W  100 STREET"):
+            self.assertEqual(normalize_street(street), "WEST 100 STREET")
+        self.assertEqual(normalize_street("1st Ave"), "1 AVENUE")
+        self.assertEqual(normalize_street("St Marks Pl"), "ST MARKS PLACE")
+        self.assertEqual(normalize_street("N"), "N")
+        self.assertTrue(self.index.contains("Gold St", 1))
+
+    def test_prefix(self):
+        """Test prefix lookup is ordered and borough specific."""
+        self.assertEqual(self.index.prefix("gold", 1), ["GOLD STREET", "GOLDEN AVENUE"])
+        self.assertEqual(self.index.prefix("BROAD", 1, limit=1), ["BROAD STREET"])
+        self.assertEqual(self.index.prefix("BROAD", 3), [])
+        self.assertEqual(self.index.prefix("", 1), [])
+
+    def test_fuzzy(self):
+        """Test fuzzy lookup ranks the closest name first."""
+        matches = self.index.fuzzy("GOLF STREET", 1)
+        self.assertEqual(matches[0][0], "GOLD STREET")
+        self.assertTrue(0 < matches[0][1] < 1)
+        self.assertEqual(self.index.fuzzy("XYZZY", 1), [])
+
+    def test_candidates(self):
+        """Test candidates combine prefix and fuzzy matches."""
+        candidates = self.index.candidates("BRODWAY", 1, limit=2)
+        self.assertEqual(candidates[0], "BROADWAY")
+        self.assertLessEqual(len(candidates), 2)
+
+    def test_load(self):
+        """Test loading street files with and without a borough code."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "streets.txt")
+            with open(path, "w") as f:
+                f.write("# comment\n1,GOLD STREET\n\n4,QUEENS BOULEVARD\n")
+            index = StreetNameIndex.from_file(path)
+            self.assertEqual(len(index), 2)
+            self.assertTrue(index.is_complete(4))
+            self.assertFalse(index.is_complete(2))
+
+            with open(path, "w") as f:
+                f.write("FULTON STREET\n")
+            index.load(path, borough_code=3)
+            self.assertTrue(index.contains("FULTON STREET", 3))
+
+            with open(path, "w") as f:
+                f.write("GOLD STREET\n")
+            with self.assertRaises(ValueError):
+                index.load(path)
+
+
+class TestSuggestWithStreetIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_geosupport = MagicMock()
+        self.mock_func = MagicMock()
+        self.mock_geosupport.__getitem__.return_value = self.mock_func
+
+    def test_learns_similar_names(self):
+        """Test SIMILAR NAMES responses populate the index."""
+        error = GeosupportError({})
+        error.result = {
+            "Message": "SIMILAR NAMES",
+            "List of Street Names": ["GOLD STREET", "GOLD AVENUE"],
+        }
+        self.mock_func.side_effect = [error, {}, {}]
+
+        index = StreetNameIndex()
+        s = GeosupportSuggest(self.mock_geosupport, street_index=index)
+        s.suggestions("100 Gol", borough_code=1)
+
+        self.assertTrue(index.contains("GOLD AVENUE", 1))
+        self.assertFalse(index.is_complete(1))
+
+    def test_complete_borough_skips_failing_call(self):
+        """Test a complete borough index replaces the native call."""
+        self.mock_func.return_value = {
+            "First Borough Name": "MANHATTAN",
+            "House Number - Display Format": "100",
+            "First Street Name Normalized": "GOLD STREET",
+        }
+        index = StreetNameIndex()
+        index.add_many(["GOLD STREET", "BROADWAY"], 1)
+        index.mark_complete(1)
+
+        s = GeosupportSuggest(
+            self.mock_geosupport, street_index=index, street_index_top_k=1
+        )
+        result = s.suggestions("100 Gld st", borough_code=1)
+
+        self.assertEqual(len(result), 1)
+        self.mock_func.assert_called_once_with(
+            house_number="100", street="GOLD STREET", borough_code=1, zip=None
+        )
+
+    def test_complete_borough_abbreviated_street(self):
+        """Test abbreviated spellings of indexed streets keep the native call."""
+        self.mock_func.return_value = {
+            "First Borough Name": "MANHATTAN",
+            "House Number - Display Format": "100",
+            "First Street Name Normalized": "WEST 100 STREET",
+        }
+        index = StreetNameIndex()
+        index.add_many(["GOLD STREET", "EAST 100 STREET", "WEST 100 STREET"], 1)
+        index.mark_complete(1)
+
+        s = GeosupportSuggest(self.mock_geosupport, street_index=index)
+        for address in ("100 Gold St", "100 W 100 ST", "100 West 100th Street"):
+            self.mock_func.reset_mock()
+            s.suggestions(address, borough_code=1)
+            self.mock_func.assert_called_once()
+            street = self.mock_func.call_args.kwargs["street"]
+            self.assertTrue(index.contains(street, 1), street)
+
+    def test_complete_borough_without_candidates(self):
+        """Test unknown streets in complete boroughs cost no native calls."""
+        index = StreetNameIndex()
+        index.add("BROADWAY", 1)
+        index.mark_complete(1)
+
+        s = GeosupportSuggest(self.mock_geosupport, street_index=index)
+        self.mock_func.return_value = None
+        s.suggestions("100 Xyzzy st", borough_code=1)
+
+        self.mock_func.assert_not_called()
+
+
+def _result(bbl, bin_, lat, lon):
+    return {
+        "First Borough Name": "MANHATTAN",
+        "BOROUGH BLOCK LOT (BBL)": {"BOROUGH BLOCK LOT (BBL)": bbl},
+        "Building Identification Number (BIN)": bin_,
+        "Latitude": lat,
+        "Longitude": lon,
+    }
+
+
+class TestResultIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = ResultIndex()
+        self.index.add(
+            "100 Gold St", [_result("1000950001", "1001234", 40.7105, -74.0040)]
+        )
+        self.index.add(
+            "1 Centre St", [_result("1001210001", "1001235", 40.7130, -74.0040)]
+        )
+        self.index.add(
+            "1 Gold St", [_result("1000950001", "1001236", 40.7080, -74.0060)]
+        )
+        self.index.add(
+            "Queens", [_result("4000010001", "4000001", 40.7500, -73.8000), None]
+        )
+
+    def test_by_bbl_and_bin(self):
+        """Test hash lookups by BBL and BIN."""
+        inputs = [e.input for e in self.index.by_bbl("1000950001")]
+        self.assertEqual(inputs, ["100 Gold St", "1 Gold St"])
+        self.assertEqual(self.index.by_bin("1001235")[0].input, "1 Centre St")
+        self.assertEqual(self.index.by_bbl("9999999999"), [])
+        self.assertEqual(len(self.index), 4)
+
+    def test_nearest(self):
+        """Test nearest results are ordered by distance."""
+        nearest = self.index.nearest(40.7106, -74.0041, k=2)
+        self.assertEqual([e.input for e, _ in nearest], ["100 Gold St", "1 Centre St"])
+        self.assertLess(nearest[0][1], 20)
+
+        far = self.index.nearest(40.7500, -73.8001, k=1)
+        self.assertEqual(far[0][0].input, "Queens")
+        self.assertEqual(self.index.nearest(40.0, -75.0, max_distance_m=100), [])
+
+    def test_nearest_outside_extent(self):
+        """Test queries far outside the indexed area return promptly."""
+        index = ResultIndex()
+        index.add("100 Gold St", [_result("1000950001", "1001234", 40.7105, -74.0040)])
+        started = time.perf_counter()
+        nearest = index.nearest(0.0, 0.0, k=3)
+        self.assertEqual([e.input for e, _ in nearest], ["100 Gold St"])
+
+        nearest = self.index.nearest(41.5, -75.0, k=10)
+        self.assertEqual(len(nearest), len(self.index))
+        self.assertEqual(nearest[-1][0].input, "Queens")
+        self.assertLess(time.perf_counter() - started, 1)
+
+    def test_nearest_visits_nearby_cells_only(self):
+        """Test an outlier or evicted entries do not widen nearby searches."""
+        index = ResultIndex(max_size=201)
+        index.add("Outlier", [_result("5000010001", "5000001", 0.0, 0.0)])
+        for i in range(200):
+            lat, lon = 40.6 + (i // 20) * 0.01, -74.1 + (i % 20) * 0.01
+            index.add(f"{i} Grid St", [_result("", str(2000000 + i), lat, lon)])
+
+        distance = index_module._distance_m
+        for _ in range(2):
+            with patch.object(
+                index_module, "_distance_m", side_effect=distance
+            ) as calls:
+                nearest = index.nearest(40.6502, -74.0498, k=1)
+            self.assertEqual(nearest[0][0].input, "105 Grid St")
+            self.assertLessEqual(calls.call_count, 25)
+            # Evict the outlier
+            index.add("Extra", [_result("", "3000000", 40.65, -74.05)])
+        self.assertEqual(index.nearest(0.0, 0.0, k=1)[0][0].input, "19 Grid St")
+
+    def test_within(self):
+        """Test radius queries."""
+        inputs = [e.input for e in self.index.within(40.7105, -74.0040, 400)]
+        self.assertEqual(inputs, ["100 Gold St", "1 Centre St", "1 Gold St"])
+
+    def test_maintained_by_suggestions(self):
+        """Test GeosupportSuggest adds new results to the index."""
+        mock_geosupport = MagicMock()
+        mock_geosupport.__getitem__.return_value = MagicMock(
+            return_value=_result("1000950001", "1001234", 40.7105, -74.0040)
+        )
+        index = ResultIndex()
+        s = GeosupportSuggest(mock_geosupport, result_index=index)
+        for _ in range(3):
+            s.suggestions("100 Gold St", borough_code=1)
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(len(index.by_bin("1001234")), 1)
+
+    def test_readd_replaces(self):
+        """Test re-adding a result for the same input replaces it."""
+        updated = _result("1000950001", "1001234", 40.7106, -74.0041)
+        self.index.add("100 Gold St", [updated])
+        self.assertEqual(len(self.index), 4)
+        entries = self.index.by_bbl("1000950001")
+        self.assertEqual([e.input for e in entries], ["1 Gold St", "100 Gold St"])
+        self.assertIs(entries[1].result, updated)
+        self.assertEqual(len(self.index.within(40.7106, -74.0041, 5)), 1)
+
+    def test_max_size_evicts_oldest(self):
+        """Test the index is bounded and evicts the oldest entries."""
+        index = ResultIndex(max_size=2)
+        for i in range(3):
+            index.add(
+                f"{i} Gold St", [_result(f"100095000{i}", f"100123{i}", 40.71, -74.0)]
+            )
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.by_bin("1001230"), [])
+        self.assertEqual(index.by_bbl("1000950002")[0].input, "2 Gold St")
+        inputs = [e.input for e in index.within(40.71, -74.0, 10)]
+        self.assertEqual(sorted(inputs), ["1 Gold St", "2 Gold St"])
@@ -0,0 +1,81 @@
+import time
+import unittest
+from unittest.mock import MagicMock
+from geosupport import GeosupportError
+
+from suggest import GeosupportSuggest
+
+
+class TestNegativeCache(unittest.TestCase):
+
+    def setUp(self):
+        def mock_geocode(**kwargs):
+            street = kwargs["street"]
+            if street == "GOL":
+                error = GeosupportError({})
+                error.result = {
+                    "Message": "SIMILAR NAMES",
+                    "List of Street Names": ["GOLD STREET"],
+                }
+                raise error
+            if street == "GOLD STREET":
+                return {
+                    "First Borough Name": "MANHATTAN",
+                    "House Number - Display Format": kwargs["house_number"],
+                    "First Street Name Normalized": street,
+                }
+            error = GeosupportError({})
+            error.result = {"Message": "NOT RECOGNIZED"}
+            raise error
+
+        self.mock_geosupport = MagicMock()
+        self.mock_func = MagicMock(side_effect=mock_geocode)
+        self.mock_geosupport.__getitem__.return_value = self.mock_func
+
+    def test_disabled_by_default(self):
+        """Test no negative cache exists unless requested."""
+        s = GeosupportSuggest(self.mock_geosupport, use_cache=True)
+        self.assertIsNone(s.negative_cache)
+        s.suggestions("100 Junk St")
+        self.assertEqual(s.cache.stats()["size"], 1)
+
+    def test_empty_results_cached_separately(self):
+        """Test junk inputs are served from the negative cache."""
+        s = GeosupportSuggest(
+            self.mock_geosupport,
+            use_cache=True,
+            use_negative_cache=True,
+            negative_cache_size=10,
+            negative_cache_ttl=0.1,
+        )
+        self.assertEqual(s.suggestions("100 Junk St"), [])
+        calls = self.mock_func.call_count
+        self.assertEqual(s.suggestions("100 Junk St"), [])
+        self.assertEqual(self.mock_func.call_count, calls)
+        self.assertEqual(s.cache.stats()["size"], 0)
+        self.assertEqual(s.negative_cache.max_size, 10)
+
+        # Negative entries expire on their own TTL
+        time.sleep(0.2)
+        s.suggestions("100 Junk St")
+        self.assertEqual(self.mock_func.call_count, calls * 2)
+
+    def test_negative_cache_without_result_cache(self):
+        """Test the negative cache works with the result cache disabled."""
+        s = GeosupportSuggest(self.mock_geosupport, use_negative_cache=True)
+        s.suggestions("100 Junk St", borough_code=1)
+        s.suggestions("100 Junk St", borough_code=1)
+        self.assertEqual(self.mock_func.call_count, 1)
+
+    def test_similar_names_cached_per_street(self):
+        """Test SIMILAR NAMES lists are reused for other house numbers."""
+        s = GeosupportSuggest(self.mock_geosupport, use_negative_cache=True)
+        first = s.suggestions("100 Gol", borough_code=1)
+        self.assertEqual(self.mock_func.call_count, 2)
+
+        second = s.suggestions("200 Gol", borough_code=1)
+        self.assertEqual(self.mock_func.call_count, 3)
+        self.mock_func.assert_called_with(
+            house_number="200", street="GOLD STREET", borough_code=1, zip=None
+        )
+        self.assertEqual(len(first), len(second))
@@ -0,0 +1,127 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+from geosupport import GeosupportError
+
+from suggest import GeosupportSuggest
+from suggest.pool import GeosupportPool
+
+
+class TestGeosupportPool(unittest.TestCase):
+
+    def test_handles_created_on_demand(self):
+        """Test handles are created lazily and reused after release."""
+        factory = MagicMock(side_effect=lambda: object())
+        pool = GeosupportPool(factory, size=2)
+        self.assertEqual(factory.call_count, 0)
+
+        with pool.checkout() as first:
+            pass
+        with pool.checkout() as second:
+            self.assertIs(first, second)
+        self.assertEqual(factory.call_count, 1)
+        self.assertEqual(pool.stats()["idle"], 1)
+
+    def test_size_limit_and_timeout(self):
+        """Test checkout waits when every handle is in use."""
+        pool = GeosupportPool(object, size=1, timeout=0.05)
+        handle = pool.acquire()
+        with self.assertRaises(TimeoutError):
+            pool.acquire()
+
+        threading.Timer(0.01, pool.release, args=(handle,)).start()
+        pool.timeout = 2
+        self.assertIs(pool.acquire(), handle)
+
+    def test_health_check_replaces_handle(self):
+        """Test an unhealthy idle handle is discarded and replaced."""
+        healthy = {"ok": False}
+        pool = GeosupportPool(object, size=1, health_check=lambda h: healthy["ok"])
+        with pool.checkout() as first:
+            pass
+        with pool.checkout() as second:
+            self.assertIsNot(first, second)
+        stats = pool.stats()
+        self.assertEqual((stats["created"], stats["discarded"]), (2, 1))
+
+    def test_unexpected_error_discards_handle(self):
+        """Test expected errors keep the handle and other errors discard it."""
+        pool = GeosupportPool(object, size=1, expected_errors=(KeyError,))
+        with self.assertRaises(KeyError):
+            with pool.checkout():
+                raise KeyError("not found")
+        self.assertEqual(pool.stats()["discarded"], 0)
+
+        with self.assertRaises(OSError):
+            with pool.checkout():
+                raise OSError("work area corrupted")
+        self.assertEqual(pool.stats()["discarded"], 1)
+        self.assertEqual(pool.stats()["handles"], 0)
+
+    def test_invalid_size(self):
+        """Test a pool needs at least one handle."""
+        with self.assertRaises(ValueError):
+            GeosupportPool(object, size=0)
+
+
+class TestSuggestPooling(unittest.TestCase):
+
+    def _make_handle(self):
+        """Mock Geosupport handle that records concurrent use."""
+
+        def geocode(**kwargs):
+            with self.lock:
+                self.active[id(handle)] = self.active.get(id(handle), 0) + 1
+                self.max_active = max(self.max_active, sum(self.active.values()))
+                shared = self.active[id(handle)] > 1
+            time.sleep(0.02)
+            with self.lock:
+                self.active[id(handle)] -= 1
+                self.shared_use |= shared
+            if kwargs["borough_code"] != 1:
+                error = GeosupportError({})
+                error.result = {"Message": "NOT RECOGNIZED"}
+                raise error
+            return {
+                "First Borough Name": "MANHATTAN",
+                "House Number - Display Format": kwargs["house_number"],
+                "First Street Name Normalized": "GOLD STREET",
+            }
+
+        handle = MagicMock()
+        handle.__getitem__.return_value = MagicMock(side_effect=geocode)
+        return handle
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.active = {}
+        self.max_active = 0
+        self.shared_use = False
+
+    def test_parallel_workers_use_own_handles(self):
+        """Test parallel calls run concurrently without sharing a handle."""
+        s = GeosupportSuggest(geosupport_factory=self._make_handle, max_workers=5)
+        results = s.suggestions("100 Gold St", parallel=True)
+
+        self.assertEqual(len(results), 1)
+        self.assertFalse(self.shared_use)
+        self.assertGreater(self.max_active, 1)
+        stats = s.pool.stats()
+        self.assertLessEqual(stats["created"], 5)
+        self.assertEqual(stats["discarded"], 0)
+        self.assertEqual(stats["in_use"], 0)
+
+    def test_pool_size(self):
+        """Test pool_size caps the number of handles."""
+        s = GeosupportSuggest(
+            geosupport_factory=self._make_handle, max_workers=5, pool_size=2
+        )
+        s.suggestions("100 Gold St", parallel=True)
+        self.assertEqual(s.pool.stats()["created"], 2)
+        self.assertLessEqual(self.max_active, 2)
+
+    def test_requires_geosupport_or_factory(self):
+        """Test initialization needs a Geosupport object or a factory."""
+        with self.assertRaises(ValueError):
+            GeosupportSuggest()
@@ -0,0 +1,178 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from suggest import GeosupportSuggest
+from suggest.scheduler import (
+    BATCH,
+    INTERACTIVE,
+    PriorityScheduler,
+    SchedulerOverloaded,
+)
+
+
+class TestPriorityScheduler(unittest.TestCase):
+
+    def _hold(self, scheduler, cls, started, release):
+        """Start a thread holding a slot of class ``cls`` until ``release``."""
+
+        def run():
+            with scheduler.slot(cls):
+                started.release()
+                release.wait()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def _wait_for(self, predicate):
+        deadline = time.time() + 2
+        while not predicate():
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.005)
+
+    def test_interactive_goes_before_batch(self):
+        """Test waiting interactive calls are admitted ahead of batch calls."""
+        scheduler = PriorityScheduler(max_concurrent=1)
+        started, release = threading.Semaphore(0), threading.Event()
+        holder = self._hold(scheduler, INTERACTIVE, started, release)
+        started.acquire()
+
+        order = []
+
+        def run(cls):
+            with scheduler.slot(cls):
+                order.append(cls)
+
+        threads = [threading.Thread(target=run, args=(BATCH,))]
+        threads[0].start()
+        self._wait_for(lambda: scheduler.stats()[BATCH]["waiting"] == 1)
+        threads.append(threading.Thread(target=run, args=(INTERACTIVE,)))
+        threads[1].start()
+        self._wait_for(lambda: scheduler.stats()[INTERACTIVE]["waiting"] == 1)
+
+        release.set()
+        for t in [holder] + threads:
+            t.join()
+        self.assertEqual(order, [INTERACTIVE, BATCH])
+
+    def test_class_limits(self):
+        """Test batch calls never exceed their limit, leaving room for interactive."""
+        scheduler = PriorityScheduler(max_concurrent=3, limits={BATCH: 1})
+        started, release = threading.Semaphore(0), threading.Event()
+        threads = [self._hold(scheduler, BATCH, started, release) for _ in range(2)]
+        started.acquire()
+        self._wait_for(lambda: scheduler.stats()[BATCH]["waiting"] == 1)
+        self.assertEqual(scheduler.stats()[BATCH]["running"], 1)
+
+        # Interactive calls still get a slot immediately
+        with scheduler.slot(INTERACTIVE):
+            self.assertEqual(scheduler.stats()[INTERACTIVE]["running"], 1)
+
+        release.set()
+        for t in threads:
+            t.join()
+        stats = scheduler.stats()[BATCH]
+        self.assertEqual((stats["running"], stats["admitted"]), (0, 2))
+
+    def test_rejects_when_queue_full(self):
+        """Test batch work is shed once its queue is full."""
+        scheduler = PriorityScheduler(max_concurrent=1, max_queue={BATCH: 1})
+        started, release = threading.Semaphore(0), threading.Event()
+        threads = [self._hold(scheduler, INTERACTIVE, started, release)]
+        started.acquire()
+        threads.append(self._hold(scheduler, BATCH, started, release))
+        self._wait_for(lambda: scheduler.stats()[BATCH]["waiting"] == 1)
+
+        with self.assertRaises(SchedulerOverloaded):
+            scheduler.acquire(BATCH)
+        self.assertEqual(scheduler.stats()[BATCH]["rejected"], 1)
+
+        release.set()
+        for t in threads:
+            t.join()
+
+    def test_unknown_class(self):
+        """Test an unknown priority class raises ValueError."""
+        with self.assertRaises(ValueError):
+            PriorityScheduler().acquire("urgent")
+
+
+class TestSuggestScheduling(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_geosupport = MagicMock()
+        self.mock_func = MagicMock(
+            return_value={
+                "First Borough Name": "MANHATTAN",
+                "House Number - Display Format": "100",
+                "First Street Name Normalized": "GOLD STREET",
+            }
+        )
+        self.mock_geosupport.__getitem__.return_value = self.mock_func
+
+    def test_calls_admitted_by_class(self):
+        """Test suggestions use the instance class and batches use 'batch'."""
+        scheduler = PriorityScheduler()
+        s = GeosupportSuggest(self.mock_geosupport, scheduler=scheduler)
+        s.suggestions("100 Gold St, Manhattan")
+        s.suggestions_batch(["100 Gold St, Manhattan", "100 Gold St, Manhattan"])
+
+        stats = scheduler.stats()
+        self.assertEqual(stats[INTERACTIVE]["admitted"], 1)
+        self.assertEqual(stats[BATCH]["admitted"], 2)
+        self.assertEqual(s.priority, INTERACTIVE)
+
+    def test_batch_defers_shed_calls(self):
+        """Test a batch retries shed calls instead of discarding its results."""
+        scheduler = PriorityScheduler()
+        acquire = scheduler.acquire
+        calls = []
+        rejections = [SchedulerOverloaded("batch queue is full")]
+
+        def flaky_acquire(cls):
+            # Shed the second address's first call
+            calls.append(cls)
+            if len(calls) == 2 and rejections:
+                raise rejections.pop()
+            return acquire(cls)
+
+        s = GeosupportSuggest(self.mock_geosupport, scheduler=scheduler)
+        with patch.object(scheduler, "acquire", side_effect=flaky_acquire), patch(
+            "suggest.suggest.BATCH_RETRY_DELAY", 0.001
+        ):
+            results = s.suggestions_batch(["100 Gold St, Manhattan"] * 3)
+
+        self.assertEqual([len(r) for r in results], [1, 1, 1])
+        self.assertEqual(rejections, [])
+        self.assertEqual(scheduler.stats()[BATCH]["admitted"], 3)
+
+    def test_overload_propagates_from_parallel(self):
+        """Test a rejected call fails the request instead of returning partial results."""
+        scheduler = PriorityScheduler(max_concurrent=1, max_queue={INTERACTIVE: 0})
+        s = GeosupportSuggest(self.mock_geosupport, scheduler=scheduler)
+        with scheduler.slot(INTERACTIVE):
+            with self.assertRaises(SchedulerOverloaded):
+                s.suggestions("100 Gold St", parallel=True)
+        self.mock_func.assert_not_called()
+
+    def test_idle_scheduler_admits_with_empty_queue(self):
+        """Test calls that can run at once are never shed."""
+        scheduler = PriorityScheduler(max_queue={BATCH: 0, INTERACTIVE: 0})
+        s = GeosupportSuggest(self.mock_geosupport, scheduler=scheduler)
+        results = s.suggestions_batch(["100 Gold St, Manhattan"] * 2)
+
+        self.assertEqual([len(r) for r in results], [1, 1])
+        self.assertEqual(scheduler.stats()[BATCH]["rejected"], 0)
+
+    def test_batch_retries_are_bounded(self):
+        """Test a batch gives up after BATCH_RETRY_ATTEMPTS rejections."""
+        scheduler = PriorityScheduler(max_concurrent=1, max_queue={BATCH: 0})
+        s = GeosupportSuggest(self.mock_geosupport, scheduler=scheduler)
+        with scheduler.slot(INTERACTIVE), patch(
+            "suggest.suggest.BATCH_RETRY_DELAY", 0.001
+        ), patch("suggest.suggest.BATCH_RETRY_ATTEMPTS", 3):
+            with self.assertRaises(SchedulerOverloaded):
+                s.suggestions_batch(["100 Gold St, Manhattan"])
+        self.assertEqual(scheduler.stats()[BATCH]["rejected"], 3)
@@ -0,0 +1,259 @@
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from suggest import GeosupportSuggest
+from suggest.scheduler import BATCH, INTERACTIVE, PriorityScheduler
+from suggest.server import MicroBatcher, make_server
+
+
+def _fake_geosupport():
+    def mock_geocode(**kwargs):
+        if kwargs.get("borough_code") not in (1, None):
+            return {}
+        return {
+            "First Borough Name": "MANHATTAN",
+            "House Number - Display Format": kwargs.get("house_number"),
+            "First Street Name Normalized": "GOLD STREET",
+            "Latitude": "40.7",
+            "Longitude": "-74.0",
+        }
+
+    mock_geosupport = MagicMock()
+    mock_function = MagicMock(side_effect=mock_geocode)
+    mock_geosupport.__getitem__.return_value = mock_function
+    return mock_geosupport, mock_function
+
+
+class TestMicroBatcher(unittest.TestCase):
+
+    def test_deduplicates_concurrent_requests(self):
+        """Test identical concurrent requests share one Geosupport call."""
+        geosupport, function = _fake_geosupport()
+        batcher = MicroBatcher(
+            GeosupportSuggest(geosupport), batch_window=0.2, parallel=False
+        )
+        try:
+            futures = [batcher.submit("100 Gold St", 1) for _ in range(10)]
+            results = [f.result(timeout=5) for f in futures]
+        finally:
+            batcher.close()
+
+        self.assertEqual(function.call_count, 1)
+        self.assertTrue(all(r == results[0] for r in results))
+        stats = batcher.stats()
+        self.assertEqual(stats["requests"], 10)
+        self.assertEqual(stats["deduplicated"], 9)
+        self.assertIsNotNone(stats["latency_ms"]["p99"])
+
+    def test_distinct_requests_overlap(self):
+        """Test distinct concurrent requests are geocoded concurrently."""
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def slow_geocode(**kwargs):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return {
+                "First Borough Name": "MANHATTAN",
+                "House Number - Display Format": kwargs["house_number"],
+                "First Street Name Normalized": "GOLD STREET",
+            }
+
+        geosupport = MagicMock()
+        geosupport.__getitem__.return_value = MagicMock(side_effect=slow_geocode)
+        batcher = MicroBatcher(
+            GeosupportSuggest(geosupport, max_workers=5), batch_window=0.01
+        )
+        try:
+            started = time.perf_counter()
+            futures = [batcher.submit(f"{n} Gold St", 1) for n in range(1, 21)]
+            results = [f.result(timeout=5) for f in futures]
+            elapsed = time.perf_counter() - started
+        finally:
+            batcher.close()
+
+        self.assertEqual(
+            [r[0]["House Number - Display Format"] for r in results],
+            [str(n) for n in range(1, 21)],
+        )
+        self.assertGreater(active["max"], 1)
+        self.assertLess(elapsed, 20 * 0.05 / 2)
+
+    def test_errors_reach_waiters(self):
+        """Test invalid input raises in the caller."""
+        geosupport, _ = _fake_geosupport()
+        batcher = MicroBatcher(GeosupportSuggest(geosupport), batch_window=0)
+        try:
+            with self.assertRaises(ValueError):
+                batcher.submit("100 Gold St", 9).result(timeout=5)
+        finally:
+            batcher.close()
+
+    def test_parallel_calls_share_one_pool(self):
+        """Test parallel borough calls from all requests run on one worker pool."""
+        threads = set()
+
+        def geocode(**kwargs):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.01)
+            return None
+
+        geosupport = MagicMock()
+        geosupport.__getitem__.return_value = MagicMock(side_effect=geocode)
+        suggest = GeosupportSuggest(geosupport, max_workers=3)
+        batcher = MicroBatcher(suggest, batch_window=0.01, workers=4)
+        try:
+            futures = [batcher.submit(f"{n} Gold St") for n in range(1, 9)]
+            for f in futures:
+                f.result(timeout=5)
+        finally:
+            batcher.close()
+            suggest.close()
+
+        self.assertTrue(all(t.startswith("geosupport-suggest") for t in threads))
+        self.assertLessEqual(len(threads), 3)
+
+    def test_bad_item_does_not_stop_dispatcher(self):
+        """Test a malformed item fails only its own future."""
+        geosupport, _ = _fake_geosupport()
+        batcher = MicroBatcher(GeosupportSuggest(geosupport), batch_window=0.05)
+        try:
+            bad = batcher.submit(123, None)
+            good = batcher.submit("100 Gold St", 1)
+            with self.assertRaises(ValueError):
+                bad.result(timeout=5)
+            self.assertTrue(good.result(timeout=5))
+            self.assertTrue(batcher.submit("200 Gold St", 1).result(timeout=5))
+            self.assertTrue(batcher._thread.is_alive())
+        finally:
+            batcher.close()
+
+    def test_priority_classes(self):
+        """Test submissions run in their class and are not shared across classes."""
+        geosupport, function = _fake_geosupport()
+        scheduler = PriorityScheduler()
+        batcher = MicroBatcher(
+            GeosupportSuggest(geosupport, scheduler=scheduler),
+            batch_window=0.2,
+            parallel=False,
+        )
+        try:
+            futures = [
+                batcher.submit("100 Gold St", 1),
+                batcher.submit("100 Gold St", 1, BATCH),
+                batcher.submit("100 Gold St", 1, BATCH),
+            ]
+            for f in futures:
+                f.result(timeout=5)
+        finally:
+            batcher.close()
+
+        stats = scheduler.stats()
+        self.assertEqual(stats[INTERACTIVE]["admitted"], 1)
+        self.assertEqual(stats[BATCH]["admitted"], 1)
+        self.assertEqual(function.call_count, 2)
+        self.assertEqual(batcher.suggest.priority, INTERACTIVE)
+
+
+class TestSuggestServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        geosupport, cls.function = _fake_geosupport()
+        suggest = GeosupportSuggest(
+            geosupport, use_cache=True, scheduler=PriorityScheduler()
+        )
+        cls.server = make_server(suggest, port=0, batch_window=0.01)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _get(self, path):
+        with urlopen(self.base + path, timeout=5) as r:
+            return json.loads(r.read())
+
+    def _post(self, path, body):
+        request = Request(
+            self.base + path,
+            data=json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urlopen(request, timeout=5) as r:
+            return json.loads(r.read())
+
+    def test_suggest(self):
+        """Test the /suggest endpoint returns normalized results."""
+        body = self._get("/suggest?address=100+Gold+St&borough_code=1")
+        self.assertEqual(body["results"][0]["street"], "GOLD STREET")
+
+        geojson = self._get("/suggest?address=100+Gold+St&format=geojson")
+        self.assertEqual(geojson["results"]["type"], "FeatureCollection")
+
+    def test_suggest_bad_request(self):
+        """Test missing addresses and bad formats return 400."""
+        for path in ("/suggest", "/suggest?address=1+Gold&format=xml"):
+            with self.assertRaises(HTTPError) as ctx:
+                self._get(path)
+            self.assertEqual(ctx.exception.code, 400)
+
+    def test_batch(self):
+        """Test the /batch endpoint preserves order and reports errors."""
+        body = self._post(
+            "/batch",
+            ["100 Gold St", {"address": "200 Gold St", "borough_code": 9}],
+        )
+        results = body["results"]
+        self.assertEqual(results[0]["input"], "100 Gold St")
+        self.assertTrue(results[0]["results"])
+        self.assertIn("error", results[1])
+
+    def test_batch_runs_at_batch_priority(self):
+        """Test /batch calls are admitted as batch work and /suggest as interactive."""
+        before = self._get("/stats")["scheduler"]
+        self._post("/batch", ["400 Gold St, Manhattan"])
+        self._get("/suggest?address=500+Gold+St+Manhattan")
+        after = self._get("/stats")["scheduler"]
+
+        for cls in (INTERACTIVE, BATCH):
+            self.assertEqual(after[cls]["admitted"] - before[cls]["admitted"], 1)
+
+    def test_batch_rejects_non_string_address(self):
+        """Test a malformed batch entry returns 400 and the server keeps serving."""
+        for body in ([{"address": 123}], [["100 Gold St"]]):
+            with self.assertRaises(HTTPError) as ctx:
+                self._post("/batch", body)
+            self.assertEqual(ctx.exception.code, 400)
+
+        body = self._get("/suggest?address=100+Gold+St&borough_code=1")
+        self.assertTrue(body["results"])
+        self.assertTrue(self._post("/batch", ["100 Gold St"])["results"][0]["results"])
+
+    def test_concurrent_clients_and_stats(self):
+        """Test concurrent clients are batched and stats are exposed."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda _: self._get("/suggest?address=300+Gold+St&borough_code=1"),
+                    range(8),
+                )
+            )
+
+        stats = self._get("/stats")
+        self.assertGreaterEqual(stats["requests"], 8)
+        self.assertLess(stats["batches"], stats["requests"])
+        self.assertIn("hits", stats["cache"])
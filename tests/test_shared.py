@@ -0,0 +1,155 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from suggest import GeosupportSuggest
+from suggest.shared import SharedResultStore, SharedResultWriter
+from suggest.suggest import make_cache_key
+
+RESULT = {
+    "First Borough Name": "MANHATTAN",
+    "House Number - Display Format": "100",
+    "First Street Name Normalized": "GOLD STREET",
+    "Latitude": "40.7105",
+    "Longitude": "-74.0040",
+    "BOROUGH BLOCK LOT (BBL)": {"BOROUGH BLOCK LOT (BBL)": "1000950001"},
+    "Some Unprojected Field": "dropped",
+}
+
+
+class TestSharedResultStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "results.store")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Test projected results are readable from the mapped file."""
+        writer = SharedResultWriter(self.path)
+        for i in range(50):
+            writer.add(make_cache_key(f"{i} Gold St"), [RESULT])
+        writer.add(make_cache_key("1 Nowhere"), [])
+        self.assertEqual(writer.commit(), 51)
+
+        store = SharedResultStore(self.path)
+        self.assertEqual(len(store), 51)
+        results = store.get(make_cache_key("7 Gold St"))
+        self.assertEqual(results[0]["First Street Name Normalized"], "GOLD STREET")
+        self.assertEqual(
+            results[0]["BOROUGH BLOCK LOT (BBL)"], RESULT["BOROUGH BLOCK LOT (BBL)"]
+        )
+        self.assertNotIn("Some Unprojected Field", results[0])
+        self.assertEqual(store.get(make_cache_key("1 Nowhere")), [])
+        self.assertIsNone(store.get(make_cache_key("missing")))
+        self.assertEqual(store.stats()["hits"], 2)
+
+    def test_missing_file_and_refresh(self):
+        """Test a store starts empty and picks up published snapshots."""
+        store = SharedResultStore(self.path, refresh_interval=0)
+        key = make_cache_key("100 Gold St")
+        self.assertIsNone(store.get(key))
+
+        writer = SharedResultWriter(self.path)
+        writer.add(key, [RESULT])
+        writer.commit()
+        self.assertIsNotNone(store.get(key))
+
+        writer.add(make_cache_key("200 Gold St"), [RESULT])
+        writer.commit()
+        self.assertEqual(len(store), 2)
+
+    def test_truncated_or_foreign_file(self):
+        """Test damaged store files are ignored instead of raising."""
+        key = make_cache_key("100 Gold St")
+        writer = SharedResultWriter(self.path)
+        writer.add(key, [RESULT])
+        writer.commit()
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        for damaged in (b"GSS", data[:40], data[:-10], b"GSSTORE1" + b"\xff" * 40):
+            with open(self.path, "wb") as f:
+                f.write(damaged)
+            store = SharedResultStore(self.path)
+            self.assertEqual(len(store), 0)
+            self.assertIsNone(store.get(key))
+
+        # A corrupt record inside an intact file is a miss; records start
+        # right after the JSON metadata with their result count
+        record = data.index(b"]}") + 2
+        with open(self.path, "wb") as f:
+            f.write(data[:record] + b"\xff" * 4 + data[record + 4 :])
+        store = SharedResultStore(self.path)
+        self.assertEqual(len(store), 1)
+        self.assertIsNone(store.get(key))
+
+        writer.commit()
+        self.assertTrue(store.refresh())
+        self.assertIsNotNone(store.get(key))
+
+    def test_other_process_reads(self):
+        """Test another process reads the same file."""
+        key = make_cache_key("100 Gold St")
+        writer = SharedResultWriter(self.path)
+        writer.add(key, [RESULT])
+        writer.commit()
+
+        code = (
+            "import sys; from suggest.shared import SharedResultStore; "
+            "r = SharedResultStore(sys.argv[1]).get(sys.argv[2]); "
+            "print(r[0]['First Borough Name'])"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code, self.path, key],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(out.stdout.strip(), "MANHATTAN")
+
+    def test_suggest_reads_shared_store(self):
+        """Test GeosupportSuggest serves hits from the store without Geosupport."""
+        mock_geosupport = MagicMock()
+        mock_geosupport.__getitem__.return_value = MagicMock(return_value=RESULT)
+        warm = GeosupportSuggest(mock_geosupport, use_cache=True)
+        warm.suggestions("100 Gold St", borough_code=1)
+
+        writer = SharedResultWriter(self.path)
+        self.assertEqual(writer.add_cache(warm.cache), 1)
+        writer.commit()
+
+        cold_geosupport = MagicMock()
+        cold = GeosupportSuggest(
+            cold_geosupport, use_cache=True, shared_store=SharedResultStore(self.path)
+        )
+        results = cold.suggestions("100 Gold St", borough_code=1)
+
+        self.assertEqual(
+            cold.format_address(results[0]), "100 GOLD STREET, MANHATTAN, NY"
+        )
+        cold_geosupport.__getitem__.assert_not_called()
+
+    def test_function_mismatch_skipped(self):
+        """Test a store written for another Geosupport function is not served."""
+        key = make_cache_key("100 Gold St", borough_code=1)
+        writer = SharedResultWriter(self.path, func="1B")
+        writer.add(key, [RESULT])
+        writer.commit()
+        store = SharedResultStore(self.path)
+        self.assertFalse(store.matches("AP"))
+        self.assertTrue(store.matches("1b"))
+        self.assertIsNone(store.get(key, func="AP"))
+
+        mock_geosupport = MagicMock()
+        mock_geosupport.__getitem__.return_value = MagicMock(return_value=None)
+        with self.assertLogs("suggest.suggest", "WARNING"):
+            s = GeosupportSuggest(mock_geosupport, func="AP", shared_store=store)
+        self.assertEqual(s.suggestions("100 Gold St", borough_code=1), [])
+        mock_geosupport.__getitem__.assert_called_with("AP")
+        self.assertEqual(store.stats()["hits"], 0)
@@ -0,0 +1,92 @@
+import json
+import unittest
+from unittest.mock import MagicMock
+from geosupport import GeosupportError
+
+from suggest import GeosupportSuggest
+from suggest.trace import NULL_SPAN, Tracer
+
+
+def _geosupport():
+    def mock_geocode(**kwargs):
+        if kwargs["street"] == "GOL":
+            error = GeosupportError({})
+            error.result = {
+                "Message": "SIMILAR NAMES",
+                "List of Street Names": ["GOLD STREET", "GOLD AVENUE"],
+            }
+            raise error
+        return {
+            "First Borough Name": "MANHATTAN",
+            "House Number - Display Format": kwargs["house_number"],
+            "First Street Name Normalized": kwargs["street"],
+        }
+
+    mock_geosupport = MagicMock()
+    mock_geosupport.__getitem__.return_value = MagicMock(side_effect=mock_geocode)
+    return mock_geosupport
+
+
+def _names(tree):
+    return [c["name"] for c in tree["children"]]
+
+
+class TestTracing(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        """Test no tracer or spans exist unless tracing is enabled."""
+        s = GeosupportSuggest(_geosupport())
+        s.suggestions("100 Gol", borough_code=1)
+        self.assertIsNone(s.tracer)
+        self.assertIs(s._span, NULL_SPAN)
+
+    def test_span_tree(self):
+        """Test a trace records parsing, phases and every Geosupport call."""
+        s = GeosupportSuggest(_geosupport(), trace=True, rate_limit=0.01)
+        s.suggestions("100 Gol", borough_code=1)
+
+        tree = s.tracer.last.to_dict()
+        self.assertEqual(tree["name"], "suggestions")
+        self.assertEqual(tree["attributes"]["arg.0"], "100 Gol")
+        self.assertEqual(tree["attributes"]["results"], 2)
+        self.assertEqual(_names(tree), ["parse", "location", "similar_names"])
+
+        location, similar = tree["children"][1], tree["children"][2]
+        first = location["children"][0]
+        self.assertEqual(first["attributes"]["outcome"], "similar_names")
+        self.assertEqual(first["attributes"]["street"], "GOL")
+        self.assertEqual(_names(similar), ["geocode", "geocode"])
+        waits = [
+            c["attributes"].get("rate_limit_wait_ms", 0) for c in similar["children"]
+        ]
+        self.assertTrue(any(w > 0 for w in waits))
+        self.assertIsNotNone(tree["duration_ms"])
+        json.loads(s.tracer.to_json())
+
+    def test_cache_lookup_span(self):
+        """Test cache hits are traced without Geosupport calls."""
+        s = GeosupportSuggest(_geosupport(), trace=True, use_cache=True)
+        s.suggestions("100 Gold St", borough_code=1, parallel=True)
+        s.suggestions("100 Gold St", borough_code=1, parallel=True)
+
+        miss, hit = [t.to_dict() for t in s.tracer.traces]
+        self.assertFalse(miss["children"][0]["attributes"]["hit"])
+        self.assertEqual(_names(hit), ["cache.get"])
+        self.assertTrue(hit["children"][0]["attributes"]["hit"])
+
+    def test_otlp_export(self):
+        """Test OpenTelemetry export links spans into one trace."""
+        tracer = Tracer()
+        s = GeosupportSuggest(_geosupport(), trace=tracer)
+        s.suggestions("100 Gold St", borough_code=1)
+
+        spans = tracer.to_otlp()["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        root = spans[0]
+        self.assertEqual(root["parentSpanId"], "")
+        self.assertTrue(all(sp["traceId"] == root["traceId"] for sp in spans))
+        ids = {sp["spanId"] for sp in spans}
+        self.assertTrue(all(sp["parentSpanId"] in ids for sp in spans[1:]))
+        geocode = [sp for sp in spans if sp["name"] == "geocode"][0]
+        attributes = {a["key"]: a["value"] for a in geocode["attributes"]}
+        self.assertEqual(attributes["borough_code"], {"intValue": "1"})
+        self.assertEqual(attributes["outcome"], {"stringValue": "result"})